@@ -8,14 +8,20 @@ and call categorization. The results are streamed back to the client in real-tim
 """
 
 import asyncio
+import hashlib
 import json
+import os
+import re
 import sys
-from collections.abc import AsyncGenerator
+import tempfile
+from collections.abc import AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, NamedTuple, TypeVar
 
-import aiofiles
-from fastapi import FastAPI, File, Form, UploadFile
+import numpy as np
+import orjson
+from fastapi import FastAPI, File, Form, Header, Response, UploadFile
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
@@ -25,6 +31,7 @@ sys.path.append(str(Path(__file__).resolve().parent.parent))
 # Import individual modules
 from call_processor_modules import (
     categorize_call,
+    config,
     pii_check,
     profanity_check,
     sentiment_analysis,
@@ -32,17 +39,67 @@ from call_processor_modules import (
     speaker_speed,
     transcription,
 )
+from call_processor_modules.audio import load_waveform
+from call_processor_modules.pydantic_models import (
+    AnalyseSentimentOutput,
+    CalculateSpeakingSpeedOutput,
+    CheckPIIOutput,
+    CheckProfanityOutput,
+    CheckRequiredPhrasesOutput,
+    DiarizeOutput,
+    SpeakerSpeechData,
+    TranscribeAudioSegmentOutput,
+)
 from call_processor_modules.required_phrases_check import (
     CheckRequiredPhrasesInput,
     check_required_phrases,
 )
+from call_processor_modules.result_cache import (
+    RESULTS_VERSION,
+    has_result,
+    load_result,
+    store_result,
+)
 from call_processor_modules.speaker import (
     GetSpeakerSpeechDataInput,
     get_speaker_speech_data,
 )
+from logger_config import get_logger
+
+logger = get_logger()
 
 app = FastAPI()
 
+# Diarization labels of the speakers shown in the summary table columns
+SUMMARY_SPEAKERS = ("SPEAKER_00", "SPEAKER_01")
+
+# Size of each read from the uploaded file while streaming it to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Uploads are re-read by every processing module. Setting UPLOAD_DIR to a
+# tmpfs such as /dev/shm keeps them in RAM; it is opt-in because tmpfs can be
+# small (64 MB in Docker). Unset, the default temp directory is used.
+UPLOAD_DIR = os.getenv("UPLOAD_DIR") or None
+
+
+# Whisper and pyannote already parallelize internally, so model calls from all
+# requests share a small dedicated pool instead of the default thread pool
+MODEL_WORKERS = 2
+MODEL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=MODEL_WORKERS, thread_name_prefix="model",
+)
+
+# Results also depend on the models and the analysis settings, so the entity
+# tag of a result covers the whole configuration
+RESULTS_CONFIG_DIGEST = hashlib.sha256(
+    orjson.dumps(config, option=orjson.OPT_SORT_KEYS),
+).hexdigest()
+
+# Hex SHA-256 digest sent by clients, used as a cache key on disk
+AUDIO_DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+ResultT = TypeVar("ResultT")
+
 
 class TranscriptionRequest(BaseModel):
     """Request model for transcription input."""
@@ -50,240 +107,427 @@ class TranscriptionRequest(BaseModel):
     text: str
 
 
+async def _run_model(func: Callable[..., ResultT], *args: object) -> ResultT:
+    """Run a blocking model call on the dedicated model executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(MODEL_EXECUTOR, func, *args)
+
+
+def _decode_waveform(file_path: str) -> tuple[np.ndarray | None, int | None]:
+    """Decode the uploaded audio once for all models.
+
+    When decoding fails, no waveform is returned and each model reads the file
+    itself, reporting the failure in its own result ("False" or empty).
+    """
+    try:
+        return load_waveform(file_path)
+    except Exception:
+        logger.exception("Failed to decode audio file {}", file_path)
+        return None, None
+
+
+def _results_etag(audio_digest: str, selected_tasks: frozenset[str]) -> str:
+    """Return the entity tag identifying the results of a processing request.
+
+    Results are fully determined by the audio content, the selected tasks,
+    the models and the configuration.
+    """
+    key = (
+        f"{RESULTS_VERSION}:{RESULTS_CONFIG_DIGEST}:"
+        f"{audio_digest}:{','.join(sorted(selected_tasks))}"
+    )
+    return f'"{hashlib.sha256(key.encode()).hexdigest()}"'
+
+
+def _has_stored_results(audio_digest: str, selected_tasks: frozenset[str]) -> bool:
+    """Return whether the model results of a request are stored in the cache.
+
+    Failed transcriptions and diarizations are never stored, so a request
+    without stored results may have failed and must be processed again.
+    """
+    return has_result(audio_digest, "transcription") and (
+        "Speaker Diarization" not in selected_tasks
+        or has_result(audio_digest, "diarization")
+    )
+
+
 @app.post("/process_call/")
 async def process_call(
     file: Annotated[UploadFile, File(...)],
     tasks: Annotated[str, Form(...)],
-) -> StreamingResponse:
+    x_audio_sha256: Annotated[str | None, Header()] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
     """Process an audio file and perform the selected tasks.
 
+    The response carries an `ETag` identifying the results. A client that
+    already holds them can send the SHA-256 of the audio in `X-Audio-SHA256`
+    together with `If-None-Match`; when the tag matches and the results are
+    stored in the cache, `304 Not Modified` is returned without storing or
+    processing the upload.
+
     Args:
         file: The uploaded audio file.
         tasks: A JSON string containing the list of tasks to perform.
+        x_audio_sha256: Optional hex SHA-256 of the audio file content.
+        if_none_match: Optional entity tag(s) of results held by the client.
 
     Returns:
-        StreamingResponse: A streaming response with the results of the tasks.
+        Response: A streaming response with the results of the tasks, or an
+        empty 304 response when the client's results are still valid.
 
     """
-    file_path = f"temp_{file.filename}"
-    async with aiofiles.open(file_path, "wb") as buffer:
-        await buffer.write(await file.read())
-
-    # Parse the selected tasks
-    selected_tasks = json.loads(tasks)
+    # Parse the selected tasks into a set for constant-time membership checks
+    selected_tasks = frozenset(json.loads(tasks))
+
+    if x_audio_sha256 and if_none_match:
+        client_digest = x_audio_sha256.lower()
+        etag = _results_etag(client_digest, selected_tasks)
+        if (
+            etag in if_none_match
+            and AUDIO_DIGEST_PATTERN.fullmatch(client_digest)
+            and _has_stored_results(client_digest, selected_tasks)
+        ):
+            return Response(status_code=304, headers={"ETag": etag})
+
+    fd, file_path = tempfile.mkstemp(
+        suffix=Path(file.filename or "").suffix, dir=UPLOAD_DIR,
+    )
+    audio_hash = hashlib.sha256()
+    # Plain buffered writes: each chunk is small and already in memory, so
+    # handing every write to a thread pool would cost more than it saves
+    try:
+        with os.fdopen(fd, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                audio_hash.update(chunk)
+                buffer.write(chunk)
+    except BaseException:
+        Path(file_path).unlink(missing_ok=True)
+        raise
+    audio_digest = audio_hash.hexdigest()
 
     return StreamingResponse(
-        process_call_step_by_step(file_path, selected_tasks),
+        process_call_step_by_step(file_path, audio_digest, selected_tasks),
         media_type="text/event-stream",
+        headers={"ETag": _results_etag(audio_digest, selected_tasks)},
+    )
+
+
+async def _transcribe(
+    file_path: str,
+    audio_digest: str,
+    waveform: np.ndarray | None,
+    sample_rate: int | None,
+) -> TranscribeAudioSegmentOutput:
+    """Transcribe the audio file and cache a successful transcription."""
+    transcription_input = transcription.TranscribeAudioSegmentInput(
+        audio_file=file_path, waveform=waveform, sample_rate=sample_rate,
     )
+    full_transcription = await _run_model(
+        transcription.transcribe_audio_segment, transcription_input)
+    # Failed transcriptions are reported as "False" and must not be cached
+    if full_transcription.transcription != "False":
+        store_result(audio_digest, "transcription", full_transcription)
+    return full_transcription
+
+
+async def _diarization_event(
+    diarization_task: asyncio.Future[DiarizeOutput] | None,
+    diarization_results: DiarizeOutput | None,
+    audio_digest: str,
+) -> tuple[DiarizeOutput | None, bytes]:
+    """Wait for a running diarization and cache it when it found speakers.
+
+    Returns the diarization results, or the cached ones when no diarization
+    was running, together with the event reporting them.
+    """
+    if diarization_task is not None:
+        diarization_results = await diarization_task
+        if diarization_results.speaker_segments:
+            store_result(audio_digest, "diarization", diarization_results)
+    return diarization_results, _format_result(
+        "diarization", diarization_results.model_dump())
+
+
+async def _speaking_speed(
+    file_path: str,
+    diarization_results: DiarizeOutput,
+    waveform: np.ndarray | None,
+    sample_rate: int | None,
+) -> tuple[SpeakerSpeechData, CalculateSpeakingSpeedOutput]:
+    """Transcribe each speaker's segments and compute their speaking speed."""
+    if waveform is None:
+        waveform, sample_rate = await asyncio.to_thread(
+            _decode_waveform, file_path)
+    speech_data_input = GetSpeakerSpeechDataInput(
+        audio_file=file_path,
+        speaker_segments=diarization_results.speaker_segments,
+        waveform=waveform,
+        sample_rate=sample_rate,
+    )
+    speaker_speech_data = await _run_model(
+        get_speaker_speech_data, speech_data_input)
+    speed_results = await asyncio.to_thread(
+        speaker_speed.calculate_speaking_speed, speaker_speech_data)
+    return speaker_speech_data, speed_results
+
+
+class TextAnalysis(NamedTuple):
+    """A text analysis run on the transcription, and how its result is sent."""
+
+    step: str
+    error_message: str
+    analyse: Callable[[BaseModel], BaseModel]
+    input_model: type[BaseModel]
+    # Whether the input accepts the shared lowercased copy of the text
+    takes_lowered_text: bool = False
+
+
+# Text analyses by the task that enables them, in source order
+TEXT_ANALYSES = {
+    "PII Check": TextAnalysis(
+        "pii", "PII check failed", pii_check.check_pii, pii_check.CheckPIIInput,
+        takes_lowered_text=True,
+    ),
+    "Profanity Check": TextAnalysis(
+        "profanity", "Profanity check failed",
+        profanity_check.check_profanity, profanity_check.CheckProfanityInput,
+    ),
+    "Required Phrases": TextAnalysis(
+        "required_phrases", "Required phrases check failed",
+        check_required_phrases, CheckRequiredPhrasesInput,
+        takes_lowered_text=True,
+    ),
+    "Sentiment Analysis": TextAnalysis(
+        "sentiment", "Sentiment analysis failed",
+        sentiment_analysis.analyse_sentiment,
+        sentiment_analysis.AnalyseSentimentInput,
+    ),
+    "Call Category": TextAnalysis(
+        "category", "Call categorization failed",
+        categorize_call.categorize, categorize_call.CategorizeInput,
+        takes_lowered_text=True,
+    ),
+}
+
+
+async def _stream_text_analyses(
+    text: str,
+    selected_tasks: frozenset[str],
+    analysis_results: dict[str, BaseModel],
+) -> AsyncGenerator[bytes, None]:
+    """Run the selected text analyses concurrently and yield their events.
+
+    Text analyses only depend on the transcription, so each is streamed as
+    soon as it finishes rather than in source order. Successful results are
+    collected in `analysis_results` by step.
+    """
+    # Lowercased once and shared by the checks that match case-insensitively
+    lowered_text = text.lower()
+    pending = {}
+    for task, analysis in TEXT_ANALYSES.items():
+        if task not in selected_tasks:
+            continue
+        fields = {"lowered_text": lowered_text} if analysis.takes_lowered_text else {}
+        analysis_input = analysis.input_model(transcribed_text=text, **fields)
+        running = asyncio.create_task(
+            asyncio.to_thread(analysis.analyse, analysis_input))
+        pending[running] = (analysis.step, analysis.error_message)
+
+    while pending:
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            step, error_message = pending.pop(task)
+            if (error := task.exception()) is not None:
+                yield _format_error(error_message, str(error))
+                continue
+            analysis_results[step] = task.result()
+            yield _format_result(step, analysis_results[step].model_dump())
 
 
 async def process_call_step_by_step(
-    file_path: str, selected_tasks: list[str],
-) -> AsyncGenerator[str, None]:
+    file_path: str, audio_digest: str, selected_tasks: frozenset[str],
+) -> AsyncGenerator[bytes, None]:
     """Process the audio file step by step and yield results.
 
+    Transcription and diarization results are cached on disk by the audio
+    content digest, so re-submitting the same recording skips both models.
+    On a cache miss, diarization runs concurrently with transcription.
+
     Args:
         file_path: Path to the audio file.
-        selected_tasks: List of tasks to perform.
+        audio_digest: Hex digest of the audio file content.
+        selected_tasks: Set of tasks to perform.
 
     Yields:
-        str: JSON-encoded results for each step.
+        bytes: Server-sent events with the JSON-encoded result of each step.
 
     """
+    diarization_task = None
     try:
-        results: dict[str, str] = {}
-        full_transcription = None
         diarization_results = None
         speaker_speech_data = None
         speed_results = None
-        pii_results = None
-        profanity_results = None
-        phrases_results = None
-        sentiment_results = None
+        # Decoded once on the first cache miss and shared by all models
+        waveform = None
+        sample_rate = None
+        diarize = "Speaker Diarization" in selected_tasks
+
+        full_transcription = load_result(
+            audio_digest, "transcription", TranscribeAudioSegmentOutput)
+        if diarize:
+            diarization_results = load_result(
+                audio_digest, "diarization", DiarizeOutput)
+        if full_transcription is None or (diarize and diarization_results is None):
+            waveform, sample_rate = await asyncio.to_thread(
+                _decode_waveform, file_path)
+
+        # Diarization runs on the second model worker while Whisper transcribes
+        if diarize and diarization_results is None:
+            diarization_input = speaker_diarization.DiarizeInput(
+                audio_file=file_path, waveform=waveform, sample_rate=sample_rate,
+            )
+            diarization_task = asyncio.ensure_future(
+                _run_model(speaker_diarization.diarize, diarization_input))
 
         # Transcription
-        transcription_input = transcription.TranscribeAudioSegmentInput(
-            audio_file=file_path,
-        )
-        full_transcription = transcription.transcribe_audio_segment(transcription_input)
+        if full_transcription is None:
+            full_transcription = await _transcribe(
+                file_path, audio_digest, waveform, sample_rate)
+        text = full_transcription.transcription
 
         if "Transcription" in selected_tasks:
-            try:
-                results["transcription"] = full_transcription.transcription
-                yield _format_result("transcription", results["transcription"])
-                await asyncio.sleep(1)
-            except transcription.TranscriptionError as e:
-                yield _format_error("Transcription failed", str(e))
+            yield _format_result("transcription", text)
 
         # Speaker Diarization
-        if "Speaker Diarization" in selected_tasks:
-            try:
-                diarization_input=speaker_diarization.DiarizeInput(audio_file=file_path)
-                diarization_results = speaker_diarization.diarize(diarization_input)
-                results["diarization"] = {
-                    "speaker_segments": [
-                        {
-                            "start_time": segment.start_time,
-                            "end_time": segment.end_time,
-                            "speaker": segment.speaker,
-                        }
-                        for segment in diarization_results.speaker_segments
-                    ],
-                    "speaking_ratio": diarization_results.speaking_ratio,
-                    "interruptions": diarization_results.interruptions,
-                    "time_to_first_token": diarization_results.time_to_first_token,
-                }
-                yield _format_result("diarization", results["diarization"])
-                await asyncio.sleep(1)
-            except speaker_diarization.DiarizationError as e:
-                yield _format_error("Diarization failed", str(e))
+        if diarize:
+            diarization_results, event = await _diarization_event(
+                diarization_task, diarization_results, audio_digest)
+            yield event
 
         # Speaking Speed
         if "Speaking Speed" in selected_tasks and diarization_results:
-            speech_data_input = GetSpeakerSpeechDataInput(
-                audio_file=file_path,
-                speaker_segments=diarization_results.speaker_segments,
-            )
-            speaker_speech_data = get_speaker_speech_data(speech_data_input)
-            speed_results = speaker_speed.calculate_speaking_speed(speaker_speech_data)
-            results["speaking_speed"] = speed_results.speaking_speeds
-            yield _format_result("speaking_speed", results["speaking_speed"])
-            await asyncio.sleep(1)
-
-        # PII Check
-        if "PII Check" in selected_tasks and full_transcription:
-            try:
-                pii_data_input = pii_check.CheckPIIInput(
-                    transcribed_text=full_transcription.transcription,
-                )
-                pii_results = pii_check.check_pii(pii_data_input)
-                results["pii"] = {
-                    "detected": pii_results.detected,
-                    "masked_text": pii_results.masked_text,
-                }
-                yield _format_result("pii", results["pii"])
-                await asyncio.sleep(1)
-            except pii_check.PIICheckError as e:
-                yield _format_error("PII check failed", str(e))
-
-        # Profanity Check
-        if "Profanity Check" in selected_tasks and full_transcription:
-            try:
-                profanity_input_data = profanity_check.CheckProfanityInput(
-                    transcribed_text=full_transcription.transcription,
-                )
-                profanity_results =profanity_check.check_profanity(profanity_input_data)
-                results["profanity"] = {
-                    "detected": profanity_results.detected,
-                    "censored_text": profanity_results.censored_text,
-                }
-                yield _format_result("profanity", results["profanity"])
-                await asyncio.sleep(1)
-            except profanity_check.ProfanityCheckError as e:
-                yield _format_error("Profanity check failed", str(e))
-
-        # Required Phrases
-        if "Required Phrases" in selected_tasks and full_transcription:
-            try:
-                phrases_input_data = CheckRequiredPhrasesInput(
-                    transcribed_text=full_transcription.transcription,
-                )
-                phrases_results = check_required_phrases(phrases_input_data)
-                results["required_phrases"] = {
-                    "required_phrases_present":phrases_results.required_phrases_present,
-                    "present_phrases": phrases_results.present_phrases,
-                }
-                yield _format_result("required_phrases", results["required_phrases"])
-                await asyncio.sleep(1)
-            except check_required_phrases.RequiredPhrasesError as e:
-                yield _format_error("Required phrases check failed", str(e))
-
-        # Sentiment Analysis
-        if "Sentiment Analysis" in selected_tasks and full_transcription:
-            try:
-                sentiment_input_data = sentiment_analysis.AnalyseSentimentInput(
-                    transcribed_text=full_transcription.transcription,
-                )
-                sentiment_results = sentiment_analysis.analyse_sentiment(
-                    sentiment_input_data)
-                results["sentiment"] = {
-                    "polarity": sentiment_results.polarity,
-                    "subjectivity": sentiment_results.subjectivity,
-                    "overall_sentiment": sentiment_results.overall_sentiment,
-                }
-                yield _format_result("sentiment", results["sentiment"])
-                await asyncio.sleep(1)
-            except sentiment_analysis.SentimentAnalysisError as e:
-                yield _format_error("Sentiment analysis failed", str(e))
-
-        # Call Category
-        if "Call Category" in selected_tasks and full_transcription:
-            try:
-                category_input_data = categorize_call.CategorizeInput(
-                    transcribed_text=full_transcription.transcription,
-                )
-                category_output = categorize_call.categorize(category_input_data)
-                results["category"] = {"category": category_output.category}
-                yield _format_result("category", results["category"])
-                await asyncio.sleep(1)
-            except categorize_call.CategorizationError as e:
-                yield _format_error("Call categorization failed", str(e))
+            speaker_speech_data, speed_results = await _speaking_speed(
+                file_path, diarization_results, waveform, sample_rate)
+            yield _format_result("speaking_speed", speed_results.speaking_speeds)
+
+        analysis_results = {}
+        async for event in _stream_text_analyses(
+            text, selected_tasks, analysis_results,
+        ):
+            yield event
 
         # Generate Summary Table
         summary_table = _generate_summary_table(
-            speaker_speech_data, speed_results, pii_results, profanity_results,
-            phrases_results, sentiment_results,
+            speaker_speech_data,
+            speed_results,
+            analysis_results.get("pii"),
+            analysis_results.get("profanity"),
+            analysis_results.get("required_phrases"),
+            analysis_results.get("sentiment"),
         )
         yield _format_result("summary", summary_table)
 
-        # Cleanup
-        Path(file_path).unlink()
         yield _format_result("complete", "Call processing completed.")
 
     except Exception as e:
         yield _format_error("Unexpected error", str(e))
         raise  # Re-raise the exception to avoid hiding it
 
+    finally:
+        # Cleanup, also when a step fails or the client disconnects
+        if diarization_task is not None and not diarization_task.done():
+            diarization_task.cancel()
+        Path(file_path).unlink(missing_ok=True)
 
-def _format_result(step: str, result: str) -> str:
-    """Format a result as a JSON-encoded string.
+
+def _format_result(step: str, result: object) -> bytes:
+    """Format a result as a server-sent event.
 
     Args:
         step: The step name.
-        result: The result of the step.
+        result: The JSON-serializable result of the step.
 
     Returns:
-        str: JSON-encoded result.
+        bytes: Encoded event carrying the JSON-encoded result.
 
     """
-    return f"data: {json.dumps({'step': step, 'result': result})}\n\n"
+    return b"data: " + orjson.dumps({"step": step, "result": result}) + b"\n\n"
 
 
-def _format_error(message: str, error: str) -> str:
-    """Format an error as a JSON-encoded string.
+def _format_error(message: str, error: str) -> bytes:
+    """Format an error as a server-sent event.
 
     Args:
         message: The error message.
         error: The error details.
 
     Returns:
-        str: JSON-encoded error.
+        bytes: Encoded event carrying the JSON-encoded error.
 
     """
-    return f"data: {json.dumps({'step': 'error', 'result': f'{message}: {error}'})}\n\n"
+    payload = orjson.dumps({"step": "error", "result": f"{message}: {error}"})
+    return b"data: " + payload + b"\n\n"
+
+
+def _speech_data_cell(speaker_speech_data: SpeakerSpeechData, speaker: str) -> str:
+    """Format the speech data summary cell for a speaker."""
+    data = speaker_speech_data.speaker_speech_data.get(speaker)
+    if data is None:
+        return "N/A"
+    return f"Length: {data.length}\nTime: {data.time_period}"
+
+
+def _speaking_speed_cell(
+    speed_results: CalculateSpeakingSpeedOutput, speaker: str,
+) -> str:
+    """Format the speaking speed summary cell for a speaker."""
+    return f"{speed_results.speaking_speeds.get(speaker, 'N/A')}"
+
+
+def _pii_cell(pii_results: CheckPIIOutput) -> str:
+    """Format the PII check summary cell."""
+    return f"Detected: {pii_results.detected}"
+
+
+def _profanity_cell(profanity_results: CheckProfanityOutput) -> str:
+    """Format the profanity check summary cell."""
+    return f"Detected: {profanity_results.detected}"
+
+
+def _phrases_cell(phrases_results: CheckRequiredPhrasesOutput) -> str:
+    """Format the required phrases summary cell."""
+    return (
+        f"Present: {phrases_results.required_phrases_present}\n"
+        f"Phrases: {phrases_results.present_phrases}"
+    )
+
+
+def _sentiment_cell(sentiment_results: AnalyseSentimentOutput) -> str:
+    """Format the sentiment analysis summary cell."""
+    return (
+        f"Polarity: {sentiment_results.polarity}\n"
+        f"Subjectivity: {sentiment_results.subjectivity}\n"
+        f"Overall: {sentiment_results.overall_sentiment}"
+    )
 
 
 def _generate_summary_table(
-    speaker_speech_data: dict | None,
-    speed_results: dict | None,
-    pii_results: dict | None,
-    profanity_results: dict | None,
-    phrases_results: dict | None,
-    sentiment_results: dict | None,
+    speaker_speech_data: SpeakerSpeechData | None,
+    speed_results: CalculateSpeakingSpeedOutput | None,
+    pii_results: CheckPIIOutput | None,
+    profanity_results: CheckProfanityOutput | None,
+    phrases_results: CheckRequiredPhrasesOutput | None,
+    sentiment_results: AnalyseSentimentOutput | None,
 ) -> dict[str, list[list[str]]]:
     """Generate a summary table of the analysis results.
 
+    Each row is described by its label, the result it is built from, a
+    function formatting that result and whether the result is per speaker.
+    Whole-call analyses are formatted once and repeated in every speaker
+    column. Rows whose result is missing (task skipped or failed) are
+    filled with "N/A".
+
     Args:
         speaker_speech_data: Speaker speech data.
         speed_results: Speaking speed results.
@@ -296,105 +540,30 @@ def _generate_summary_table(
         dict[str, list[list[str]]]: Summary table.
 
     """
-    summary_table = {
+    row_specs = (
+        ("Speech Data", speaker_speech_data, _speech_data_cell, True),
+        ("Speaking Speed (WPM)", speed_results, _speaking_speed_cell, True),
+        ("PII Check", pii_results, _pii_cell, False),
+        ("Profanity Check", profanity_results, _profanity_cell, False),
+        ("Required Phrases", phrases_results, _phrases_cell, False),
+        ("Sentiment Analysis", sentiment_results, _sentiment_cell, False),
+    )
+
+    rows = []
+    for label, result, format_cell, per_speaker in row_specs:
+        if result is None:
+            cells = ["N/A"] * len(SUMMARY_SPEAKERS)
+        elif per_speaker:
+            cells = [format_cell(result, speaker) for speaker in SUMMARY_SPEAKERS]
+        else:
+            cells = [format_cell(result)] * len(SUMMARY_SPEAKERS)
+        rows.append([label, *cells])
+
+    return {
         "columns": ["Analysis", "Speaker 1", "Speaker 2"],
-        "rows": [],
+        "rows": rows,
     }
 
-    # Extract speaker-specific data (if available)
-    speaker_1_data = None
-    speaker_2_data = None
-    if speaker_speech_data and hasattr(speaker_speech_data, "speaker_speech_data"):
-        speaker_1_data = speaker_speech_data.speaker_speech_data.get("SPEAKER_00", None)
-        speaker_2_data = speaker_speech_data.speaker_speech_data.get("SPEAKER_01", None)
-
-    # Add rows to the summary table
-    summary_table["rows"].append([
-        "Speech Data",
-        f"Length: {speaker_1_data.length if speaker_1_data else 'N/A'}\n"
-        f"Time: {speaker_1_data.time_period if speaker_1_data else 'N/A'}",
-        f"Length: {speaker_2_data.length if speaker_2_data else 'N/A'}\n"
-        f"Time: {speaker_2_data.time_period if speaker_2_data else 'N/A'}",
-    ])
-
-    # Speaking Speed (if available)
-    if speed_results:
-        summary_table["rows"].append([
-            "Speaking Speed (WPM)",
-            f"{speed_results.speaking_speeds.get('SPEAKER_00', 'N/A')}",
-            f"{speed_results.speaking_speeds.get('SPEAKER_01', 'N/A')}",
-        ])
-    else:
-        summary_table["rows"].append([
-            "Speaking Speed (WPM)",
-            "N/A",
-            "N/A",
-        ])
-
-    # PII Check (if available)
-    if pii_results:
-        summary_table["rows"].append([
-            "PII Check",
-            f"Detected: {pii_results.detected}",
-            f"Detected: {pii_results.detected}",
-        ])
-    else:
-        summary_table["rows"].append([
-            "PII Check",
-            "N/A",
-            "N/A",
-        ])
-
-    # Profanity Check (if available)
-    if profanity_results:
-        summary_table["rows"].append([
-            "Profanity Check",
-            f"Detected: {profanity_results.detected}",
-            f"Detected: {profanity_results.detected}",
-        ])
-    else:
-        summary_table["rows"].append([
-            "Profanity Check",
-            "N/A",
-            "N/A",
-        ])
-
-    # Required Phrases (if available)
-    if phrases_results:
-        summary_table["rows"].append([
-            "Required Phrases",
-            f"Present: {phrases_results.required_phrases_present}\n"
-            f"Phrases: {phrases_results.present_phrases}",
-            f"Present: {phrases_results.required_phrases_present}\n"
-            f"Phrases: {phrases_results.present_phrases}",
-        ])
-    else:
-        summary_table["rows"].append([
-            "Required Phrases",
-            "N/A",
-            "N/A",
-        ])
-
-    # Sentiment Analysis (if available)
-    if sentiment_results:
-        summary_table["rows"].append([
-            "Sentiment Analysis",
-            f"Polarity: {sentiment_results.polarity}\n"
-            f"Subjectivity: {sentiment_results.subjectivity}\n"
-            f"Overall: {sentiment_results.overall_sentiment}",
-            f"Polarity: {sentiment_results.polarity}\n"
-            f"Subjectivity: {sentiment_results.subjectivity}\n"
-            f"Overall: {sentiment_results.overall_sentiment}",
-        ])
-    else:
-        summary_table["rows"].append([
-            "Sentiment Analysis",
-            "N/A",
-            "N/A",
-        ])
-
-    return summary_table
-
 
 if __name__ == "__main__":
     import uvicorn
@@ -18,7 +18,8 @@ such as speaking speed, sentiment analysis, and more
 Dependencies:
 - Streamlit: Web framework for creating the dashboard
 - Requests: To send requests to the backend FastAPI server
-- JSON: To handle JSON responses from the backend
+- Requests-Toolbelt: To stream the multipart audio upload from disk
+- orjson: To handle JSON responses from the backend
 
 Usage:
 1. Upload an audio file.
@@ -28,16 +29,38 @@ Usage:
 
 """
 
-import json
+import hashlib
+import os
 import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
 
+import orjson
 import requests
 import streamlit as st
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util import Retry
+
+# Settings such as UPLOAD_DIR can be given in the project's .env file
+load_dotenv()
 
 # Define the FastAPI backend URL
 BACKEND_URL = "http://127.0.0.1:8000"
 
+# Size of the blocks copied from the uploaded file to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+# Size of the reads from the streamed backend response
+SSE_CHUNK_SIZE = 1 << 16
+
+# Directory of the saved upload; like the backend, set UPLOAD_DIR to a tmpfs
+# such as /dev/shm to keep it in RAM. Unset, the default temp directory is used.
+UPLOAD_DIR = os.getenv("UPLOAD_DIR") or None
+
 # List of available tasks
 TASKS = [
     "Transcription",
@@ -50,30 +73,25 @@ TASKS = [
     "Call Category",
 ]
 
-# Initialize session state variables
-if "transcription_output" not in st.session_state:
-    st.session_state.update({
-        "transcription_output": "Not selected",
-        "transcription_status": "❌ Not selected",
-        "diarization_output": "Not selected",
-        "diarization_status": "❌ Not selected",
-        "speaking_speed_output": "Not selected",
-        "speaking_speed_status": "❌ Not selected",
-        "pii_output": "Not selected",
-        "pii_status": "❌ Not selected",
-        "profanity_output": "Not selected",
-        "profanity_status": "❌ Not selected",
-        "phrases_output": "Not selected",
-        "phrases_status": "❌ Not selected",
-        "sentiment_output": "Not selected",
-        "sentiment_status": "❌ Not selected",
-        "category_output": "Not selected",
-        "category_status": "❌ Not selected",
-        "summary_output": "Summary table will appear here...",
-        "summary_status": "❌ Not selected",
-        "process_output": "Not selected",
-        "process_status": "❌ Not selected",
-    })
+# Steps whose output and status are shown, with the task that enables them
+TASK_STEPS = {
+    "Transcription": "transcription",
+    "Speaker Diarization": "diarization",
+    "Speaking Speed": "speaking_speed",
+    "PII Check": "pii",
+    "Profanity Check": "profanity",
+    "Required Phrases": "required_phrases",
+    "Sentiment Analysis": "sentiment",
+    "Call Category": "category",
+}
+
+# Raw result and status of every step, kept in one session state entry;
+# results are only formatted when the page is rendered
+if "task_state" not in st.session_state:
+    st.session_state["task_state"] = {
+        step: {"result": None, "status": "❌ Not selected"}
+        for step in [*TASK_STEPS.values(), "summary", "complete"]
+    }
 
 def initialize_results(selected_tasks: list[str]) -> dict[str, str]:
     """Initialize the results dictionary and set UI status for selected tasks."""
@@ -90,215 +108,262 @@ def initialize_results(selected_tasks: list[str]) -> dict[str, str]:
         "message": "Not selected",
     }
 
-    status_mapping = {
-        "Transcription": "transcription_status",
-        "Speaker Diarization": "diarization_status",
-        "Speaking Speed": "speaking_speed_status",
-        "PII Check": "pii_status",
-        "Profanity Check": "profanity_status",
-        "Required Phrases": "phrases_status",
-        "Sentiment Analysis": "sentiment_status",
-        "Call Category": "category_status",
-    }
-
     for task in selected_tasks:
-        key = status_mapping.get(task)
-        if key:
+        step = TASK_STEPS.get(task)
+        if step:
             results[task.lower().replace(" ", "_")] = "Processing..."
-            setattr(st.session_state, key, "⏳ Processing")
+            st.session_state["task_state"][step]["status"] = "⏳ Processing"
 
     return results
 
 
 
-def prepare_audio_file(audio_file: str | Path) -> dict[str, requests.Response | None]:
-    """Prepare the audio file for uploading by ensuring it's in the root directory."""
-    root_path = Path.cwd() / "uploaded_audio.mp3" # Save file in the root directory
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Return the HTTP session shared by all backend calls of this process.
 
-    if isinstance(audio_file, str):  # If it's a file path, check its location
-        audio_path = Path(audio_file)
+    Keeping one session reuses keep-alive connections to the backend, and
+    connection failures are retried with a short backoff.
+    """
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=2, backoff_factor=0.3),
+    ))
+    return session
 
-        # Move the file to root directory if it's not already there
-        if audio_path.resolve() != root_path.resolve():
-            shutil.move(audio_path, root_path)
+def prepare_audio_file(audio_file: str | Path) -> BinaryIO:
+    """Open the saved audio file for a streamed upload to the backend."""
+    return Path(audio_file).open("rb")
 
-    return {"file": root_path.open("rb")}  # Keep the file open
-
-def send_audio_to_backend(files: dict[str, requests.Response| None],
+def send_audio_to_backend(audio_handle: BinaryIO,
     selected_tasks: list[str]) -> requests.Response:
-    """Send the audio file and tasks to the backend for processing."""
-    return requests.post(
+    """Send the audio file and tasks to the backend for processing.
+
+    The multipart body is streamed from the open file handle, so the audio
+    is never buffered in memory as a whole. The audio hash and the tag of
+    the results already displayed are sent along, so the backend can answer
+    304 when they are still valid.
+    """
+    audio_sha256 = hashlib.file_digest(audio_handle, "sha256").hexdigest()
+    audio_handle.seek(0)
+    encoder = MultipartEncoder(fields={
+        "file": ("uploaded_audio.mp3", audio_handle, "audio/mpeg"),
+        "tasks": orjson.dumps(selected_tasks).decode(),
+    })
+    headers = {"Content-Type": encoder.content_type, "X-Audio-SHA256": audio_sha256}
+    if etag := st.session_state.get("results_etag"):
+        headers["If-None-Match"] = etag
+
+    return get_http_session().post(
         f"{BACKEND_URL}/process_call/",
-        files=files,
-        data={"tasks": json.dumps(selected_tasks)},
+        data=encoder,
+        headers=headers,
         timeout=1200,  # Added timeout to fix S113
         stream=True,
     )
 
-def update_transcription(result: str, results: dict[str, str]) -> None:
-    """Update transcription-related outputs."""
-    results["transcription"] = result
-    st.session_state.transcription_output = (
-        f"<span style='color:green;'>*Transcription:*</span>"
-        f"{result}"
-    )
-    st.session_state.transcription_status = "✅ Completed"
-
-def update_diarization(result: dict[str, float | str], results: dict[str, str]) -> None:
-    """Update diarization-related outputs."""
-    results["diarization"] = result
-    st.session_state.diarization_output = {
-        "speaker_segments": result["speaker_segments"],
-        "speaking_ratio": result["speaking_ratio"],
-        "interruptions": result["interruptions"],
-        "time_to_first_token": result["time_to_first_token"],
-    }
-    st.session_state.diarization_status = "✅ Completed"
+def take(result: dict[str, str | float], results: dict[str, str | list[str]],
+    step: str) -> None:
+    """Store the raw result of a step and mark the step as completed."""
+    if step not in st.session_state["task_state"]:
+        error_message = f"Unknown step: {step}"
+        raise ValueError(error_message)
+    results["message" if step == "complete" else step] = result
+    st.session_state["task_state"][step] = {"result": result, "status": "✅ Completed"}
+
+def is_failed_result(step: str, result: object) -> bool:
+    """Return whether a step reported a failure instead of a result.
+
+    Failed steps return "False" or an empty result, such as a diarization
+    without speaker segments.
+    """
+    if step == "diarization" and isinstance(result, dict):
+        result = result.get("speaker_segments")
+    return result == "False" or not result
+
+def iter_sse_data(response: requests.Response) -> Iterator[bytes]:
+    """Yield the raw payload of each `data:` event in a streamed SSE response.
+
+    The body is read in large chunks into one buffer and split on the blank
+    line that ends each event, so no per-line decoding takes place.
+    """
+    buffer = bytearray()
+    for chunk in response.iter_content(chunk_size=SSE_CHUNK_SIZE):
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n\n", start)) != -1:
+            if buffer.startswith(b"data:", start, end):
+                yield bytes(buffer[start + 5:end])
+            start = end + 2
+        del buffer[:start]
 
-def update_speaking_speed(result: dict[str, float], results: dict[str, str]) -> None:
-    """Update speaking speed-related outputs."""
-    results["speaking_speed"] = result
-    st.session_state.speaking_speed_output = (
-        "<span style='color:blue;'>*Speaking Speed (WPM):*</span>"
-    )
-    st.session_state.speaking_speed_output += "\n".join(
+def process_audio(audio_file: str, selected_tasks: list[str]) -> Exception | None:
+    """Process an audio file by sending it to the backend and updating the UI."""
+    try:
+        with prepare_audio_file(audio_file) as audio_handle:
+            response = send_audio_to_backend(audio_handle, selected_tasks)
+        if response.status_code == requests.codes.not_modified:
+            st.info("Results for this file and task selection are already shown.")
+            return None
+
+        # The shown results are replaced, so their tag no longer applies
+        st.session_state.pop("results_etag", None)
+        results = initialize_results(selected_tasks)
+
+        # Malformed events are reported together once the stream has ended
+        errors: list[tuple[str, Exception]] = []
+        # Results with failed steps are processed again on the next submit
+        failed = False
+        for payload in iter_sse_data(response):
+            try:
+                data = orjson.loads(payload)
+                step = data["step"]
+                result = data["result"]
+                take(result, results, step)
+                failed = failed or is_failed_result(step, result)
+            except orjson.JSONDecodeError as e:
+                errors.append((f"Failed to decode JSON: {e}", e))
+            except KeyError as e:
+                errors.append((f"Missing key in response: {e}", e))
+        if errors:
+            details = "; ".join(message for message, _ in errors[:3])
+            st.error(f"{len(errors)} events failed: {details}")
+            return errors[0][1]
+        if not failed:
+            st.session_state["results_etag"] = response.headers.get("ETag", "")
+    except requests.exceptions.ReadTimeout as e:
+        st.error("Backend request timed out. Please try again.")
+        return e
+    # RequestException for the backend call, OSError for reading the saved
+    # upload, ValueError (including orjson.JSONDecodeError) for bad responses
+    # and steps the page does not know, such as backend errors
+    except (requests.RequestException, OSError, ValueError) as e:
+        st.error(f"An error occurred: {e}")
+        return e
+    return None
+
+
+def render_transcription(result: str) -> None:
+    """Render the transcribed text."""
+    st.markdown(
+        f"<span style='color:green;'>*Transcription:*</span>"
+        f"{result}",
+        unsafe_allow_html=True)
+
+def render_diarization(result: dict[str, float | str]) -> None:
+    """Render the speaker segments table and the diarization metrics."""
+    # Display speaker segments in a table
+    st.table(result["speaker_segments"])
+
+    # Display additional metrics
+    st.markdown(
+        f"<span style='color:blue;'>**Speaking Ratio:**</span>"
+        f"{result['speaking_ratio']}</span>",
+        unsafe_allow_html=True)
+    st.markdown(
+        f"<span style='color:red;'>**Interruptions:**</span>"
+        f"{result['interruptions']}</span>", unsafe_allow_html=True)
+    st.markdown(
+        f"<span style='color:green;'>**Time to First Token (TTFT):**</span>"
+        f"{result['time_to_first_token']:.2f}s</span>",
+        unsafe_allow_html=True)
+
+def render_speaking_speed(result: dict[str, float]) -> None:
+    """Render the speaking speed of each speaker."""
+    speeds = "\n".join(
         [
             f"- {speaker}:"
             f"<span style='color:orange;'>{speed:.2f} wpm</span>"
             for speaker, speed in result.items()
         ],
     )
-    st.session_state.speaking_speed_status = "✅ Completed"
+    st.markdown(
+        f"<span style='color:blue;'>*Speaking Speed (WPM):*</span>{speeds}",
+        unsafe_allow_html=True)
 
-def update_pii(result: dict[str, bool | str], results: dict[str, str]) -> None:
-    """Update PII-related outputs."""
-    results["pii"] = result
-    st.session_state.pii_output = (
+def render_pii(result: dict[str, bool | str]) -> None:
+    """Render the PII detection flag and the masked text."""
+    st.markdown(
         f"<span style='color:red;'>*PII Detected:*</span> "
         f"{result['detected']}"
         f"<span style='color:green;'>*Masked Text:*</span>\n"
-        f"{result['masked_text']}"
-    )
-    st.session_state.pii_status = "✅ Completed"
+        f"{result['masked_text']}",
+        unsafe_allow_html=True)
 
-def update_profanity(result: dict[str, bool | str], results: dict[str, str]) -> None:
-    """Update profanity-related outputs."""
-    results["profanity"] = result
-    st.session_state.profanity_output = (
+def render_profanity(result: dict[str, bool | str]) -> None:
+    """Render the profanity detection flag and the censored text."""
+    st.markdown(
         f"<span style='color:red;'>*Profanity Detected:*</span>"
         f"{result['detected']}"
         f"<span style='color:green;'>*Censored Text:*</span>"
-        f"{result['censored_text']}"
-    )
-    st.session_state.profanity_status = "✅ Completed"
+        f"{result['censored_text']}",
+        unsafe_allow_html=True)
 
-def update_required_phrases(result: dict[str, list[str] | bool],
-    results: dict[str, str]) -> None:
-    """Update required phrases-related outputs."""
-    results["required_phrases"] = result
-    st.session_state.phrases_output = (
+def render_required_phrases(result: dict[str, list[str] | bool]) -> None:
+    """Render whether the required phrases are present and which were found."""
+    phrases = "\n".join([f"- {phrase}" for phrase in result["present_phrases"]])
+    st.markdown(
         f"<span style='color:purple;'>*Required Phrases Present:*</span>"
         f"{result['required_phrases_present']}"
         f"<span style='color:green;'>*Phrases Found:*</span>"
-    )
-    st.session_state.phrases_output += "\n".join(
-        [f"- {phrase}" for phrase in result["present_phrases"]],
-    )
-    st.session_state.phrases_status = "✅ Completed"
+        f"{phrases}",
+        unsafe_allow_html=True)
 
-def update_sentiment(result: dict[str, float | str], results: dict[str, str]) -> None:
-    """Update sentiment-related outputs."""
-    results["sentiment"] = result
-    st.session_state.sentiment_output = (
+def render_sentiment(result: dict[str, float | str]) -> None:
+    """Render the polarity, subjectivity and overall sentiment."""
+    st.markdown(
         f"<span style='color:blue;'>Polarity:</span>"
         f"<span style='color:green;'>{result['polarity']:.2f}</span><br>"
         f"<span style='color:blue;'>Subjectivity:</span>"
         f"<span style='color:green;'>{result['subjectivity']:.2f}</span><br>"
         f"<span style='color:blue;'>Overall Sentiment:</span>"
-        f"<span style='color:green;'>{result['overall_sentiment']}</span>"
-    )
-    st.session_state.sentiment_status = "✅ Completed"
+        f"<span style='color:green;'>{result['overall_sentiment']}</span>",
+        unsafe_allow_html=True)
 
-def update_category(result: dict[str, str], results: dict[str, str]) -> None:
-    """Update category-related outputs."""
-    results["category"] = result
-    st.session_state.category_output = (
+def render_category(result: dict[str, str]) -> None:
+    """Render the detected call category."""
+    st.markdown(
         f"<span style='color:purple;'>*Call Category:*</span>"
-        f"{result['category']}"
-    )
-    st.session_state.category_status = "✅ Completed"
-
-def update_summary(result: dict[str, str], results: dict[str, str]) -> None:
-    """Update summary-related outputs."""
-    results["summary"] = result
-    st.session_state.summary_output = result  # Store summary data
-    st.session_state.summary_status = "✅ Completed"
-
-def update_complete(result: str, results: dict[str, str]) -> None:
-    """Update process completion-related outputs."""
-    results["message"] = result
-    st.session_state.process_output = (
-        f"<span style='color:green;'>*Call Processing Status:*</span>"
-        f"{result}"
-    )
-    st.session_state.process_status = "✅ Completed"
-
-# Dictionary-based dispatch
-STEP_HANDLERS = {
-    "transcription": update_transcription,
-    "diarization": update_diarization,
-    "speaking_speed": update_speaking_speed,
-    "pii": update_pii,
-    "profanity": update_profanity,
-    "required_phrases": update_required_phrases,
-    "sentiment": update_sentiment,
-    "category": update_category,
-    "summary": update_summary,
-    "complete": update_complete,
-}
+        f"{result['category']}",
+        unsafe_allow_html=True)
 
-def take(result: dict[str, str | float], results: dict[str, str | list[str]],
-    step: str) -> None:
-    """Update the results dictionary and output variables based on the step."""
-    handler = STEP_HANDLERS.get(step)
-    if handler:
-        handler(result, results)
-    else:
-        error_message = f"Unknown step: {step}"
-        raise ValueError(error_message)
+def render_summary(result: dict[str, list]) -> None:
+    """Render the summary table."""
+    st.table(result["rows"])
 
-def process_audio(audio_file: str, selected_tasks: list[str]) -> Exception | None:
-    """Process an audio file by sending it to the backend and updating the UI."""
-    try:
-        files = prepare_audio_file(audio_file)
-        response = send_audio_to_backend(files, selected_tasks)
-
-        results = initialize_results(selected_tasks)
-
-        for line in response.iter_lines():
-            if line:
-                decoded_line = line.decode("utf-8")
-                if decoded_line.startswith("data:"):
-                    try:
-                        json_data = decoded_line[5:].strip()
-                        data = json.loads(json_data)
-                        step = data["step"]
-                        result = data["result"]
-                        take(result, results, step)
-                    except json.JSONDecodeError as e:
-                        st.error(f"Failed to decode JSON: {e}")
-                        return e
-                    except KeyError as e:
-                        st.error(f"Missing key in response: {e}")
-                        return e
-    except requests.exceptions.ReadTimeout as e:
-        st.error("Backend request timed out. Please try again.")
-        return e
-    except Exception as e:
-        st.error(f"An error occurred: {e}")
-        return e
-        raise  # Re-raise the exception to avoid hiding it
-    return None
+def render_complete(result: str) -> None:
+    """Render the final processing message."""
+    st.markdown(
+        f"<span style='color:green;'>*Call Processing Status:*</span>"
+        f"{result}",
+        unsafe_allow_html=True)
+
+class Section(NamedTuple):
+    """A section of the results page showing the result of one step."""
+
+    step: str
+    icon: str
+    title: str
+    render: Callable[[Any], None]
+    placeholder: str = "Not selected"
+    expandable: bool = True
+
+# Sections in display order
+SECTIONS = [
+    Section("transcription", "📝", "Transcription", render_transcription),
+    Section("diarization", "🗣️", "Speaker Diarization", render_diarization),
+    Section("speaking_speed", "⏩", "Speaking Speed", render_speaking_speed),
+    Section("pii", "🔒", "PII Check", render_pii),
+    Section("profanity", "🚫", "Profanity Check", render_profanity),
+    Section("required_phrases", "🔍", "Required Phrases", render_required_phrases),
+    Section("sentiment", "😊", "Sentiment Analysis", render_sentiment),
+    Section("category", "🏷️", "Call Category", render_category),
+    Section("summary", "📊", "Summary Table", render_summary,
+        placeholder="Summary table will appear here...", expandable=False),
+    Section("complete", "✅", "Call Processing Status", render_complete),
+]
 
 
 # Streamlit App
@@ -313,14 +378,16 @@ with st.sidebar:
 
     if st.button("Process Audio"):
         if audio_file is not None:
-            save_path = Path.cwd() / "uploaded_audio.mp3"
-
-            # Save the uploaded file to root directory
-            with save_path.open("wb") as f:
-                f.write(audio_file.read())
-
-            with st.spinner("Processing..."):
-                process_audio(str(save_path), selected_tasks)  # Pass correct path
+            # Save the uploaded file to a temporary file that is removed once
+            # processing ends, also when it fails
+            with tempfile.NamedTemporaryFile(
+                suffix=Path(audio_file.name).suffix, dir=UPLOAD_DIR,
+            ) as saved_file:
+                shutil.copyfileobj(audio_file, saved_file, length=UPLOAD_CHUNK_SIZE)
+                saved_file.flush()
+
+                with st.spinner("Processing..."):
+                    process_audio(saved_file.name, selected_tasks)
         else:
             st.warning("Please upload an audio file before processing.")
 
@@ -329,129 +396,18 @@ with st.sidebar:
 st.header("📝 Call Processing Results")
 
 # Display outputs in a logical order
-
-# 1. Transcription
-st.subheader("📝 Transcription")
-with st.expander("View Transcription", expanded=True):
-    st.markdown(st.session_state.get("transcription_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("transcription_status", "").startswith("✅"):
-        st.success(st.session_state["transcription_status"])
-    else:
-        st.warning(st.session_state["transcription_status"])
-
-# 2. Speaker Diarization
-st.subheader("🗣️ Speaker Diarization")
-with st.expander("View Speaker Diarization", expanded=True):
-    diarization_output = st.session_state.get("diarization_output", {})
-    if isinstance(diarization_output, dict):
-        # Display speaker segments in a table
-        if "speaker_segments" in diarization_output:
-            st.table(diarization_output["speaker_segments"])
-
-        # Display additional metrics
-        if "speaking_ratio" in diarization_output:
-            st.markdown(
-                f"<span style='color:blue;'>**Speaking Ratio:**</span>"
-                f"{diarization_output['speaking_ratio']}</span>",
-                unsafe_allow_html=True)
-        if "interruptions" in diarization_output:
-            st.markdown(
-                f"<span style='color:red;'>**Interruptions:**</span>"
-                f"{diarization_output['interruptions']}</span>", unsafe_allow_html=True)
-        if "time_to_first_token" in diarization_output:
-            st.markdown(
-                f"<span style='color:green;'>**Time to First Token (TTFT):**</span>"
-                f"{diarization_output['time_to_first_token']:.2f}s</span>",
-                unsafe_allow_html=True)
-    else:
-        st.markdown("Not selected")
-
-    if st.session_state.get("diarization_status", "").startswith("✅"):
-        st.success(st.session_state["diarization_status"])
-    else:
-        st.warning(st.session_state["diarization_status"])
-
-# 3. Speaking Speed
-st.subheader("⏩ Speaking Speed")
-with st.expander("View Speaking Speed", expanded=True):
-    st.markdown(st.session_state.get("speaking_speed_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("speaking_speed_status", "").startswith("✅"):
-        st.success(st.session_state["speaking_speed_status"])
-    else:
-        st.warning(st.session_state["speaking_speed_status"])
-
-# 4. PII Check
-st.subheader("🔒 PII Check")
-with st.expander("View PII Check", expanded=True):
-    st.markdown(st.session_state.get("pii_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("pii_status", "").startswith("✅"):
-        st.success(st.session_state["pii_status"])
-    else:
-        st.warning(st.session_state["pii_status"])
-
-# 5. Profanity Check
-st.subheader("🚫 Profanity Check")
-with st.expander("View Profanity Check", expanded=True):
-    st.markdown(st.session_state.get("profanity_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("profanity_status", "").startswith("✅"):
-        st.success(st.session_state["profanity_status"])
-    else:
-        st.warning(st.session_state["profanity_status"])
-
-# 6. Required Phrases
-st.subheader("🔍 Required Phrases")
-with st.expander("View Required Phrases", expanded=True):
-    st.markdown(st.session_state.get("phrases_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("phrases_status", "").startswith("✅"):
-        st.success(st.session_state["phrases_status"])
-    else:
-        st.warning(st.session_state["phrases_status"])
-
-# 7. Sentiment Analysis
-st.subheader("😊 Sentiment Analysis")
-with st.expander("View Sentiment Analysis", expanded=True):
-    st.markdown(st.session_state.get("sentiment_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("sentiment_status", "").startswith("✅"):
-        st.success(st.session_state["sentiment_status"])
-    else:
-        st.warning(st.session_state["sentiment_status"])
-
-# 8. Call Category
-st.subheader("🏷️ Call Category")
-with st.expander("View Call Category", expanded=True):
-    st.markdown(st.session_state.get("category_output", "Not selected"),
-    unsafe_allow_html=True)
-    if st.session_state.get("category_status", "").startswith("✅"):
-        st.success(st.session_state["category_status"])
-    else:
-        st.warning(st.session_state["category_status"])
-
-# 9. Summary Table
-st.subheader("📊 Summary Table")
-summary_output = st.session_state.get("summary_output", {})
-if isinstance(summary_output, dict) and \
-    "columns" in summary_output and "rows" in summary_output:
-    st.table(summary_output["rows"])
-else:
-    st.markdown("Summary table will appear here...")
-
-if st.session_state.get("summary_status", "").startswith("✅"):
-    st.success(st.session_state["summary_status"])
-else:
-    st.warning(st.session_state["summary_status"])
-
-# 10. Call Processing Status
-st.subheader("✅ Call Processing Status")
-with st.expander("View Call Processing Status", expanded=True):
-    st.markdown(st.session_state.get("process_output", "Not selected"),
-     unsafe_allow_html=True)
-    if st.session_state.get("process_status", "").startswith("✅"):
-        st.success(st.session_state["process_status"])
-    else:
-        st.warning(st.session_state["process_status"])
+for section in SECTIONS:
+    state = st.session_state["task_state"][section.step]
+    st.subheader(f"{section.icon} {section.title}")
+    with (
+        st.expander(f"View {section.title}", expanded=True) if section.expandable
+        else nullcontext()
+    ):
+        if state["result"] is None:
+            st.markdown(section.placeholder)
+        else:
+            section.render(state["result"])
+        if state["status"].startswith("✅"):
+            st.success(state["status"])
+        else:
+            st.warning(state["status"])
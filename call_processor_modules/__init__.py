@@ -2,28 +2,99 @@
 
 This module initializes components for processing customer service calls.
 It loads configurations from a YAML file and sets up:
-- Whisper ASR model for speech-to-text transcription.
+- Whisper ASR model for speech-to-text transcription, loaded lazily once
+  per process by `get_model`.
 - Profanity filtering using the `better_profanity` package.
 - PII (Personally Identifiable Information) pattern detection.
-- Sensitive word filtering and required phrase validation.
+- Precompiled keyword patterns for call categorization.
+- Sensitive word filtering and required phrase validation (Aho-Corasick
+  automata).
+- On-disk cache location for results keyed by audio content hash.
 
 """
 
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import whisper
+import ahocorasick
 import yaml
 from better_profanity import profanity
 
+if TYPE_CHECKING:
+    import whisper
+
 # Load the YAML configuration file
 config_path = Path("call_processor_modules/config.yaml")
 with config_path.open() as file:
     config = yaml.safe_load(file)
 
+
+@lru_cache(maxsize=1)
+def get_model() -> "whisper.Whisper":
+    """Load the configured Whisper model on first use and reuse it afterwards.
+
+    Whisper (and with it torch) is imported here, so that modules which only
+    analyse text do not load it.
+
+    :return: The process-wide Whisper model instance.
+    """
+    import whisper
+
+    return whisper.load_model(config["whisper_model"])
+
+
 # Initialize components
-model = whisper.load_model(config["whisper_model"])
 profanity_filter = profanity
+# Build the censor word set once per process rather than on every check
+profanity_filter.load_censor_words()
 pii_patterns = config["pii_patterns"]
+# Patterns without regex metacharacters are plain substrings, masked with
+# str.replace instead of going through the regex engine
+pii_literals = tuple(
+    pattern for pattern in pii_patterns.values()
+    if not set(".^$*+?{}[]\\|()").intersection(pattern)
+)
+# The remaining PII patterns fused into one alternation, tried in
+# configuration order; None when every pattern is a literal
+pii_regexes = [
+    pattern for pattern in pii_patterns.values() if pattern not in pii_literals
+]
+pii_pattern = (
+    re.compile("|".join(f"(?:{pattern})" for pattern in pii_regexes))
+    if pii_regexes else None
+)
 sensitive_words = config["sensitive_words"]
+# Sensitive words are plain substrings, so find them all in a single pass
+sensitive_words_automaton = ahocorasick.Automaton()
+for word in sensitive_words:
+    sensitive_words_automaton.add_word(word.lower(), word)
+sensitive_words_automaton.make_automaton()
 categories = config["categories"]
+# One alternation per category over lowercased keywords, matched against
+# lowercased text; longest keywords first so that multi-word keywords win over
+# the single words they contain. Categories are matched separately so that a
+# keyword shared with, or nested in, another category's keyword counts towards
+# both categories.
+category_patterns = {
+    category: re.compile(
+        r"\b(?:"
+        + "|".join(
+            re.escape(keyword)
+            for keyword in sorted(
+                {keyword.lower() for keyword in keywords}, key=len, reverse=True,
+            )
+        )
+        + r")\b",
+    )
+    for category, keywords in categories.items()
+}
 required_phrases = config["required_phrases"]
+# Required phrases are plain substrings, so find them all in a single pass;
+# each phrase maps to its position in the configuration
+required_phrases_automaton = ahocorasick.Automaton()
+for index, phrase in enumerate(required_phrases):
+    required_phrases_automaton.add_word(phrase.lower(), index)
+required_phrases_automaton.make_automaton()
+cache_dir = Path(config["cache_dir"]).expanduser()
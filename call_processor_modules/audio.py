@@ -0,0 +1,105 @@
+"""Module for decoding audio files into in-memory waveforms.
+
+Whisper and pyannote each decode the audio file on their own. Decoding it
+once with `load_waveform` and passing the waveform to both models avoids
+running FFmpeg over the same file more than once.
+
+The waveform is mono float32 sampled at 16 kHz, which is the format Whisper
+expects and the rate pyannote resamples to internally.
+
+`load_cached_waveform` keeps the most recently decoded files in memory, keyed
+by path and modification time, so transcribing many segments of one file
+decodes it only once. `load_segment` reads just one segment of a file,
+seeking to its first frame, for callers that need a single segment and not
+the whole recording.
+"""
+
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+import torch
+from torchaudio.functional import resample
+from whisper.audio import SAMPLE_RATE, load_audio
+
+from logger_config import get_logger
+
+logger = get_logger()
+
+
+def load_waveform(audio_file: str) -> tuple[np.ndarray, int]:
+    """Decode an audio file into a mono float32 waveform.
+
+    :param audio_file: Path to the audio file to decode.
+    :return: The decoded waveform and its sample rate.
+    """
+    logger.info("Decoding audio file: {}", audio_file)
+    return load_audio(audio_file), SAMPLE_RATE
+
+
+# Decoded waveforms are large (about 230 MB per hour of audio), so only the
+# last couple of files are kept
+@lru_cache(maxsize=2)
+def _load_waveform_version(
+    audio_file: str, mtime_ns: int,  # noqa: ARG001 - part of the cache key
+) -> tuple[np.ndarray, int]:
+    return load_waveform(audio_file)
+
+
+# Serializes decoding so that concurrent callers wait for one decode of a file
+# instead of each running FFmpeg over it
+_decode_lock = threading.Lock()
+
+
+def load_cached_waveform(audio_file: str) -> tuple[np.ndarray, int]:
+    """Decode an audio file, reusing the waveform of a recent decode.
+
+    A file rewritten since it was decoded has a new modification time and is
+    decoded again.
+
+    :param audio_file: Path to the audio file to decode.
+    :return: The decoded waveform and its sample rate.
+    """
+    mtime_ns = Path(audio_file).stat().st_mtime_ns
+    with _decode_lock:
+        return _load_waveform_version(audio_file, mtime_ns)
+
+
+def load_segment(
+    audio_file: str, start_time: float, end_time: float,
+) -> tuple[np.ndarray, int]:
+    """Read one segment of an audio file into a mono float32 waveform.
+
+    The file is seeked to the segment start and only the frames of the segment
+    are read and resampled. Formats that soundfile cannot read fall back to
+    slicing the cached decode of the whole file.
+
+    :param audio_file: Path to the audio file to read.
+    :param start_time: Start time of the segment in seconds.
+    :param end_time: End time of the segment in seconds.
+    :return: The segment waveform and its sample rate.
+    """
+    try:
+        with sf.SoundFile(audio_file) as f:
+            file_rate = f.samplerate
+            f.seek(int(start_time * file_rate))
+            frames = f.read(
+                int((end_time - start_time) * file_rate),
+                dtype="float32",
+                always_2d=True,
+            )
+    except sf.LibsndfileError:
+        logger.warning("Cannot seek in {}, decoding the whole file", audio_file)
+        waveform, sample_rate = load_cached_waveform(audio_file)
+        return (
+            waveform[int(start_time * sample_rate):int(end_time * sample_rate)],
+            sample_rate,
+        )
+
+    waveform = frames.mean(axis=1)
+    if file_rate != SAMPLE_RATE:
+        waveform = resample(
+            torch.from_numpy(waveform), file_rate, SAMPLE_RATE).numpy()
+    return waveform, SAMPLE_RATE
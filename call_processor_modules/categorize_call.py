@@ -5,7 +5,9 @@ calls based on predefined keyword categories. It analyzes text using regex
 pattern matching and assigns the most relevant category.
 
 Features:
-- Uses regex to identify keywords in predefined categories.
+- Counts the keyword matches of every category with that category's
+  precompiled regex over the lowercased text, reusing the caller's
+  lowercased copy when given.
 - Logs categorized results and any errors encountered.
 - Returns the most probable category or "Unknown" if no match is found.
 
@@ -18,15 +20,61 @@ Usage:
     and receive a `CategorizeOutput` object with the detected category.
 """
 
-import re
+from collections.abc import Callable
 
 from logger_config import get_logger
 
-from . import categories
+from . import categories, category_patterns
 from .pydantic_models import CategorizeInput, CategorizeOutput
+from .text_cache import memoize_per_text
 
 logger = get_logger()
 
+
+def _build_category_counter() -> Callable[[str], list[int]]:
+    """Build a keyword counter specialized to the configured categories.
+
+    The bound `findall` of every category pattern is looked up once at import
+    time instead of on every call. Each category is matched on its own, so a
+    keyword shared with or nested in another category's keyword counts
+    towards both categories.
+
+    :return: Function counting the keyword matches per category in
+             lowercased text, as a list in configuration order.
+    """
+    finders = tuple(category_patterns[category].findall for category in categories)
+
+    def count_categories(lowered_text: str) -> list[int]:
+        return [len(findall(lowered_text)) for findall in finders]
+
+    return count_categories
+
+
+count_categories = _build_category_counter()
+
+
+@memoize_per_text
+def _detect_categories(
+    text: str, *, lowered_text: str | None = None,
+) -> dict[str, int]:
+    """Count the keyword matches of every category found in a text.
+
+    :param text: Transcribed text.
+    :param lowered_text: Optional lowercased copy of `text`.
+    :return: Match count of each category with at least one match, in
+             configuration order.
+    """
+    if lowered_text is None:
+        lowered_text = text.lower()
+    return {
+        category: count
+        for category, count in zip(
+            categories, count_categories(lowered_text), strict=True,
+        )
+        if count > 0
+    }
+
+
 def categorize(data: CategorizeInput) -> CategorizeOutput:
     """Categorizes a transcribed text based on predefined categories.
 
@@ -34,28 +82,17 @@ def categorize(data: CategorizeInput) -> CategorizeOutput:
     :return: CategorizeOutput with the detected category.
     """
     try:
-        transcribed_text = data.transcribed_text
         logger.info("Starting call categorization.")
+        detected_categories = _detect_categories(
+            data.transcribed_text, lowered_text=data.lowered_text)
 
-        detected_categories = {}
-
-        for category, keywords in categories.items():
-            count = sum(1 for keyword in keywords if re.search(
-            r"\b" + keyword + r"\b", transcribed_text, re.IGNORECASE))
-            if count > 0:
-                detected_categories[category] = detected_categories.get(
-                category, 0) + count
-
-        logger.info("Detected category counts: {detected_categories}")
+        logger.info("Detected category counts: {}", detected_categories)
 
-        cat = "Unknown"
-        mx = 0
+        # Counted in configuration order, and max() keeps the first of equally
+        # counted categories, so ties go to the first configured category
+        cat = max(detected_categories, key=detected_categories.get, default="Unknown")
         if detected_categories:
-            for k, v in detected_categories.items():
-                if v > mx:
-                    mx = v
-                    cat = k
-            logger.info("Categorized call as: {cat}")
+            logger.info("Categorized call as: {}", cat)
         else:
             logger.warning("No matching category found. Categorizing as 'Unknown'.")
 
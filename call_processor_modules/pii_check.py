@@ -5,8 +5,11 @@ from transcribed text in customer service calls. It ensures compliance
 by identifying sensitive patterns and replacing them with masked placeholders.
 
 Features:
-- Uses regex patterns to detect common PII (e.g., phone numbers, emails).
-- Detects predefined sensitive words.
+- Uses a single fused regex to detect and mask common PII (e.g., phone
+  numbers, emails); literal patterns are masked with plain string
+  replacement instead.
+- Detects predefined sensitive words in a single pass over the lowercased
+  text, reusing the caller's lowercased copy when given.
 - Masks detected PII with '****' for privacy.
 - Logs detected instances and warnings.
 
@@ -21,15 +24,45 @@ Usage:
 
 """
 
-import re
-
 from call_processor_modules.pydantic_models import CheckPIIInput, CheckPIIOutput
 from logger_config import get_logger
 
-from . import pii_patterns, sensitive_words
+from . import pii_literals, pii_pattern, sensitive_words_automaton
+from .text_cache import memoize_per_text
 
 logger = get_logger()
 
+
+@memoize_per_text
+def _find_pii(
+    text: str, *, lowered_text: str | None = None,
+) -> tuple[str, int, list[str]]:
+    """Mask the PII patterns in a text and find its sensitive words.
+
+    :param text: Transcribed text.
+    :param lowered_text: Optional lowercased copy of `text`.
+    :return: The masked text, the number of masked PII matches and the
+             sensitive words found, sorted.
+    """
+    masked_text = text
+    pii_count = 0
+    for literal in pii_literals:
+        if count := masked_text.count(literal):
+            pii_count += count
+            masked_text = masked_text.replace(literal, "****")
+    # Detection and masking of the regex patterns in one pass over the text
+    if pii_pattern is not None:
+        masked_text, regex_count = pii_pattern.subn("****", masked_text)
+        pii_count += regex_count
+
+    if lowered_text is None:
+        lowered_text = text.lower()
+    found_words = sorted({
+        word for _, word in sensitive_words_automaton.iter(lowered_text)
+    })
+    return masked_text, pii_count, found_words
+
+
 def check_pii(data: CheckPIIInput) -> CheckPIIOutput:
     """Check for PII (Personally Identifiable Information) in the transcribed text.
 
@@ -37,23 +70,16 @@ def check_pii(data: CheckPIIInput) -> CheckPIIOutput:
     :return: CheckPIIOutput with detection flag and masked text.
     """
     try:
-        text = data.transcribed_text
-        detected = False
-        masked_text = text
-
         logger.info("Starting PII detection.")
-
-        for pattern in pii_patterns.values():
-            if re.search(pattern, text):
-                detected = True
-                masked_text = re.sub(pattern, "****", masked_text)
-                logger.warning("Detected possible {key} in text, masking it.")
-
-        for word in sensitive_words:
-            if word.lower() in text.lower():
-                detected = True
-                logger.warning("Sensitive word detected: {word}")
-
+        masked_text, pii_count, found_words = _find_pii(
+            data.transcribed_text, lowered_text=data.lowered_text)
+        if pii_count:
+            logger.warning(
+                "Detected {} possible PII matches, masking them.", pii_count)
+        if found_words:
+            logger.warning("Sensitive words detected: {}", found_words)
+
+        detected = bool(pii_count or found_words)
         if detected:
             logger.info("PII detected and masked.")
         else:
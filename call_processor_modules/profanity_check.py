@@ -5,7 +5,7 @@ calls to maintain professionalism and compliance with company policies.
 
 Features:
 - Uses a profanity filter to censor offensive words.
-- Loads and applies a list of predefined censor words.
+- Applies the predefined censor words, loaded once at package import.
 - Logs detected profanities and masks them in the output.
 
 Dependencies:
@@ -28,9 +28,17 @@ from call_processor_modules.pydantic_models import (
 from logger_config import get_logger
 
 from . import profanity_filter
+from .text_cache import memoize_per_text
 
 logger = get_logger()
 
+
+@memoize_per_text
+def _censor(text: str) -> str:
+    """Censor the offensive words of a text."""
+    return profanity_filter.censor(text)
+
+
 def check_profanity(data: CheckProfanityInput) -> CheckProfanityOutput:
     """Check for profanity in the transcribed text and censor offensive words.
 
@@ -38,18 +46,18 @@ def check_profanity(data: CheckProfanityInput) -> CheckProfanityOutput:
     :return: CheckProfanityOutput with detection flag and censored text.
 
     This function:
-    - Loads a predefined list of profanity words.
     - Censors any detected offensive words in the input text.
     - Logs whether profanity was detected or not.
     """
     try:
-        text = data.transcribed_text
         logger.info("Starting profanity check.")
+        text = data.transcribed_text
+        # better_profanity's contains_profanity() is itself implemented as
+        # `text != censor(text)`, so censor once and compare instead of
+        # calling both; this also ignores asterisks already in the text
+        censored_text = _censor(text)
 
-        profanity_filter.load_censor_words()
-        censored_text = profanity_filter.censor(text)
-
-        if "*" in censored_text:
+        if censored_text != text:
             logger.warning("Profanity detected in the text.")
             return CheckProfanityOutput(detected=True, censored_text=censored_text)
         logger.info("No profanity detected in the text.")
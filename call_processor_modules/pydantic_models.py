@@ -8,7 +8,8 @@ profanity filtering, speaker diarization, and transcription.
 
 Features:
 - Defines structured input/output models for different functionalities.
-- Uses Pydantic's `BaseModel` for validation and serialization.
+- Uses Pydantic's `BaseModel` for validation and serialization; models are
+  frozen through `FrozenModel` unless they are built up in place.
 - Provides well-typed attributes for accurate data handling.
 
 Usage:
@@ -21,63 +22,85 @@ Example:
 
 """
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+
+class FrozenModel(BaseModel):
+    """Immutable base for the input/output models passed between steps."""
+
+    model_config = ConfigDict(frozen=True)
 
 
 # Model for `categorize` function
-class CategorizeInput(BaseModel):
-    """Input model for categorizing transcribed text."""
+class CategorizeInput(FrozenModel):
+    """Input model for categorizing transcribed text.
+
+    `lowered_text` can carry an already lowercased copy of the text.
+    """
 
     transcribed_text: str
+    lowered_text: str | None = None
 
-class CategorizeOutput(BaseModel):
+class CategorizeOutput(FrozenModel):
     """Output model containing the detected category."""
 
     category: str
 
 # Model for `check_pii` function
-class CheckPIIInput(BaseModel):
-    """Input model for detecting Personally Identifiable Information (PII)."""
+class CheckPIIInput(FrozenModel):
+    """Input model for detecting Personally Identifiable Information (PII).
+
+    `lowered_text` can carry an already lowercased copy of the text.
+    """
 
     transcribed_text: str
+    lowered_text: str | None = None
 
-class CheckPIIOutput(BaseModel):
+class CheckPIIOutput(FrozenModel):
     """Output model indicating PII detection and masked text."""
 
     detected: bool
     masked_text: str
 
 # Model for `check_profanity` function
-class CheckProfanityInput(BaseModel):
+class CheckProfanityInput(FrozenModel):
     """Input model for detecting profanity in transcribed text."""
 
     transcribed_text: str
 
-class CheckProfanityOutput(BaseModel):
+class CheckProfanityOutput(FrozenModel):
     """Output model indicating whether profanity was detected and censored text."""
 
     detected: bool
     censored_text: str
 
 # Model for `check_required_phrases`
-class CheckRequiredPhrasesInput(BaseModel):
-    """Input model for checking the presence of required phrases in text."""
+class CheckRequiredPhrasesInput(FrozenModel):
+    """Input model for checking the presence of required phrases in text.
+
+    `lowered_text` can carry an already lowercased copy of the text. Callers
+    that only need `required_phrases_present` can set `stop_at_first` to end
+    the scan at the first phrase found.
+    """
 
     transcribed_text: str
+    lowered_text: str | None = None
+    stop_at_first: bool = False
 
-class CheckRequiredPhrasesOutput(BaseModel):
+class CheckRequiredPhrasesOutput(FrozenModel):
     """Output model indicating presence of required phrases and listing them."""
 
     required_phrases_present: bool
     present_phrases: list[str]
 
 # Model for `analyse_sentiment`
-class AnalyseSentimentInput(BaseModel):
+class AnalyseSentimentInput(FrozenModel):
     """Input model for sentiment analysis of transcribed text."""
 
     transcribed_text: str
 
-class AnalyseSentimentOutput(BaseModel):
+class AnalyseSentimentOutput(FrozenModel):
     """Output model containing polarity, subjectivity, and overall sentiment."""
 
     polarity: float
@@ -85,19 +108,26 @@ class AnalyseSentimentOutput(BaseModel):
     overall_sentiment: str
 
 # Model for `diarize`
-class DiarizeInput(BaseModel):
-    """Input model for speaker diarization from an audio file."""
+class DiarizeInput(FrozenModel):
+    """Input model for speaker diarization from an audio file.
+
+    An already decoded `waveform` can be passed to skip decoding the file.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     audio_file: str
+    waveform: np.ndarray | None = None
+    sample_rate: int | None = None
 
-class SpeakerSegment(BaseModel):
+class SpeakerSegment(FrozenModel):
     """Model representing a single speaker segment in an audio file."""
 
-    speaker: str
     start_time: float
     end_time: float
+    speaker: str
 
-class DiarizeOutput(BaseModel):
+class DiarizeOutput(FrozenModel):
     """Output model containing speaker segmentation data and insights."""
 
     speaker_segments: list[SpeakerSegment]
@@ -106,38 +136,57 @@ class DiarizeOutput(BaseModel):
     time_to_first_token: float
 
 # Model for `transcribe_audio_segment`
-class TranscribeAudioSegmentInput(BaseModel):
-    """Input model for transcribing a specific segment of an audio file."""
+class TranscribeAudioSegmentInput(FrozenModel):
+    """Input model for transcribing a specific segment of an audio file.
+
+    An already decoded 16 kHz mono `waveform` can be passed to skip decoding
+    the file.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     audio_file: str
     start_time: float | None = None
     end_time: float | None = None
+    waveform: np.ndarray | None = None
+    sample_rate: int | None = None
 
-class TranscribeAudioSegmentOutput(BaseModel):
+class TranscribeAudioSegmentOutput(FrozenModel):
     """Output model containing the transcribed text from an audio segment."""
 
     transcription: str
 
 # Model for 'get_speaker_speech_data'
-class GetSpeakerSpeechDataInput(BaseModel):
-    """Input model for retrieving speech data for different speakers."""
+class GetSpeakerSpeechDataInput(FrozenModel):
+    """Input model for retrieving speech data for different speakers.
+
+    An already decoded 16 kHz mono `waveform` can be passed to skip decoding
+    the file.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     speaker_segments: list[SpeakerSegment]
     audio_file: str
+    waveform: np.ndarray | None = None
+    sample_rate: int | None = None
 
 class SpeechData(BaseModel):
-    """Model representing the details of a speech segment."""
+    """Model representing the details of a speech segment.
+
+    Left mutable because speaker speech data is accumulated in place.
+    """
 
     length: int
     time_period: float
     speech: str
 
-class SpeakerSpeechData(BaseModel):
+class SpeakerSpeechData(FrozenModel):
     """Output model containing speaker-wise speech data."""
 
     speaker_speech_data: dict[str, SpeechData]
 
-class CalculateSpeakingSpeedOutput(BaseModel):
+class CalculateSpeakingSpeedOutput(FrozenModel):
     """Output model containing calculated speaking speeds per speaker."""
 
     speaking_speeds: dict[str, float]
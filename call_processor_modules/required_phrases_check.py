@@ -6,7 +6,10 @@ are present in a transcribed text. It helps ensure that mandatory phrases
 customer service interactions.
 
 Features:
-- Uses regex matching to detect required phrases in the transcribed text.
+- Uses an Aho-Corasick automaton to find all required phrases
+  (case-insensitively) in one scan of the lowercased text, reusing the
+  caller's lowercased copy when given.
+- Can stop at the first phrase found when only presence is needed.
 - Logs detected phrases or missing phrases for further analysis.
 - Returns a structured response with found phrases.
 
@@ -22,18 +25,46 @@ Usage:
     ```
 """
 
-import re
-
 from call_processor_modules.pydantic_models import (
     CheckRequiredPhrasesInput,
     CheckRequiredPhrasesOutput,
 )
 from logger_config import get_logger
 
-from . import required_phrases
+from . import required_phrases, required_phrases_automaton
+from .text_cache import memoize_per_text
 
 logger = get_logger()
 
+@memoize_per_text
+def _find_required_phrases(
+    text: str,
+    stop_at_first: bool,  # noqa: FBT001
+    *,
+    lowered_text: str | None = None,
+) -> list[str]:
+    """Find the required phrases in a text, case-insensitively.
+
+    :param text: Transcribed text.
+    :param stop_at_first: Whether to stop at the first phrase found.
+    :param lowered_text: Optional lowercased copy of `text`.
+    :return: The required phrases found, in configuration order.
+    """
+    if lowered_text is None:
+        lowered_text = text.lower()
+    matches = required_phrases_automaton.iter(lowered_text)
+    if stop_at_first:
+        # Only the first phrase found is needed to answer presence
+        first_match = next(matches, None)
+        found = set() if first_match is None else {first_match[1]}
+    else:
+        # One scan for all phrases, reported in configuration order
+        found = {index for _, index in matches}
+    return [
+        phrase for index, phrase in enumerate(required_phrases) if index in found
+    ]
+
+
 def check_required_phrases(
     data: CheckRequiredPhrasesInput) -> CheckRequiredPhrasesOutput:
     """Check if required phrases are present in the transcribed text.
@@ -42,17 +73,14 @@ def check_required_phrases(
     :return: CheckRequiredPhrasesOutput with a boolean flag and list of found phrases.
     """
     try:
-        transcribed_text = data.transcribed_text
         logger.info("Starting required phrases check.")
-
-        present_phrases = [
-            phrase
-            for phrase in required_phrases
-            if re.search(phrase, transcribed_text, re.IGNORECASE)
-        ]
+        present_phrases = _find_required_phrases(
+            data.transcribed_text, data.stop_at_first,
+            lowered_text=data.lowered_text,
+        )
 
         if present_phrases:
-            logger.info("Required phrases found: {present_phrases}")
+            logger.info("Required phrases found: {}", present_phrases)
         else:
             logger.warning("No required phrases found in the transcribed text.")
 
@@ -65,5 +93,3 @@ def check_required_phrases(
         logger.exception("Error in checking required phrases")
         return CheckRequiredPhrasesOutput(
         required_phrases_present=False, present_phrases=["0"])
-
-
@@ -0,0 +1,111 @@
+"""Module for caching analysis results on disk by audio content hash.
+
+Transcription and diarization are by far the most expensive steps of the
+pipeline, and the same recording is often submitted more than once (retries,
+tuning runs). Results are stored as JSON files named after the hex digest of
+the audio bytes, so identical content hits the cache regardless of file name.
+File names also carry `RESULTS_VERSION`, made of the configured Whisper model
+and `PIPELINE_VERSION`, so changing either never serves stale results.
+
+The `load_result` function returns a cached result validated against its
+Pydantic model, or `None` on a miss. The `store_result` function writes a
+result atomically so concurrent requests never read a partial file.
+`file_digest` computes the cache key of an audio file on disk, and
+`clear_results` empties the cache.
+"""
+
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from logger_config import get_logger
+
+from . import cache_dir, config
+
+logger = get_logger()
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Bump when a change to the pipeline changes the results it produces
+PIPELINE_VERSION = 1
+RESULTS_VERSION = f"{config['whisper_model']}-v{PIPELINE_VERSION}"
+
+
+def _cache_path(digest: str, name: str) -> Path:
+    """Return the cache file path for a result of the given audio digest."""
+    return cache_dir / f"{digest}.{RESULTS_VERSION}.{name}.json"
+
+
+def file_digest(audio_file: str) -> str:
+    """Return the hex SHA-256 digest of an audio file's content.
+
+    :param audio_file: Path to the audio file.
+    :return: The digest used as the file's cache key.
+    """
+    with Path(audio_file).open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def has_result(digest: str, name: str) -> bool:
+    """Return whether a result for the given audio digest is cached.
+
+    :param digest: Hex digest of the audio file content.
+    :param name: Name of the cached result (e.g. "transcription").
+    :return: True if a cache entry exists.
+    """
+    return _cache_path(digest, name).is_file()
+
+
+def load_result(digest: str, name: str, model: type[ModelT]) -> ModelT | None:
+    """Load a cached result for the given audio digest.
+
+    :param digest: Hex digest of the audio file content.
+    :param name: Name of the cached result (e.g. "transcription").
+    :param model: Pydantic model used to validate the cached JSON.
+    :return: The cached result, or None if it is missing or invalid.
+    """
+    path = _cache_path(digest, name)
+    try:
+        result = model.model_validate_json(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except ValidationError:
+        logger.warning("Ignoring invalid cache entry: {}", path)
+        return None
+    logger.info("Loaded cached {} for audio {}", name, digest)
+    return result
+
+
+def store_result(digest: str, name: str, result: BaseModel) -> None:
+    """Store a result for the given audio digest in the cache.
+
+    :param digest: Hex digest of the audio file content.
+    :param name: Name of the cached result (e.g. "transcription").
+    :param result: The result to cache.
+    """
+    path = _cache_path(digest, name)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False,
+        ) as temp_file:
+            temp_file.write(result.model_dump_json())
+        Path(temp_file.name).replace(path)
+    except OSError:
+        logger.exception("Failed to write cache entry: {}", path)
+
+
+def clear_results() -> int:
+    """Remove every cached result.
+
+    :return: The number of cache entries removed.
+    """
+    removed = 0
+    for path in cache_dir.glob("*.json"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    logger.info("Cleared {} cache entries from {}", removed, cache_dir)
+    return removed
@@ -1,9 +1,9 @@
 """Module: analyse_sentiment.
 
 This module provides functionality to perform sentiment analysis on
-transcribed text using the TextBlob library. The sentiment analysis calculates
-the polarity and subjectivity of the text and classifies the overall sentiment
-as Positive, Negative, or Neutral.
+transcribed text using the TextBlob library's pattern analyzer. The sentiment
+analysis calculates the polarity and subjectivity of the text and classifies
+the overall sentiment as Positive, Negative, or Neutral.
 
 Features:
 - Performs sentiment analysis on transcribed text.
@@ -22,8 +22,7 @@ Usage:
     ```
 """
 
-
-from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
 
 from call_processor_modules.pydantic_models import (
     AnalyseSentimentInput,
@@ -31,8 +30,18 @@ from call_processor_modules.pydantic_models import (
 )
 from logger_config import get_logger
 
+from .text_cache import memoize_per_text
+
 logger = get_logger()
 
+# TextBlob's default analyzer, created once and called directly so that no
+# TextBlob object has to be built per call
+sentiment_analyzer = PatternAnalyzer()
+
+# The analyzer's polarity and subjectivity, memoized per text
+_analyze = memoize_per_text(sentiment_analyzer.analyze)
+
+
 def analyse_sentiment(data: AnalyseSentimentInput) -> AnalyseSentimentOutput:
     """Perform sentiment analysis on transcribed text.
 
@@ -40,12 +49,8 @@ def analyse_sentiment(data: AnalyseSentimentInput) -> AnalyseSentimentOutput:
     :return: AnalyseSentimentOutput with polarity and subjectivity scores.
     """
     try:
-        text = data.transcribed_text
         logger.info("Starting sentiment analysis.")
-
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity
-        subjectivity = blob.sentiment.subjectivity
+        polarity, subjectivity = _analyze(data.transcribed_text)
 
         if polarity > 0:
             overall_sentiment = "Positive"
@@ -54,8 +59,11 @@ def analyse_sentiment(data: AnalyseSentimentInput) -> AnalyseSentimentOutput:
         elif polarity ==0:
             overall_sentiment = "Neutral"
 
-        logger.info("Sentiment Analysis Results - Polarity: {polarity:.2f}, \
-        Subjectivity: {subjectivity:.2f}, Overall Sentiment: {overall_sentiment}")
+        logger.info(
+            "Sentiment Analysis Results - Polarity: {:.2f}, "
+            "Subjectivity: {:.2f}, Overall Sentiment: {}",
+            polarity, subjectivity, overall_sentiment,
+        )
 
         return AnalyseSentimentOutput(
         polarity=polarity, subjectivity=subjectivity,
@@ -4,22 +4,58 @@ This module computes the total speech data for each
 speaker, including word count, time period, and the transcription of their speech.
 
 The `get_speaker_speech_data` function retrieves and processes the speaker
-segments and audio file, transcribing each segment and storing the data for
-each speaker.
+segments and audio file, transcribing the segments in batches and storing
+the data for each speaker.
 """
 
+import numpy as np
+from whisper.audio import SAMPLE_RATE
+
 from logger_config import get_logger
 
+from .audio import load_cached_waveform
 from .pydantic_models import (
     GetSpeakerSpeechDataInput,
+    SpeakerSegment,
     SpeakerSpeechData,
     SpeechData,
-    TranscribeAudioSegmentInput,
 )
-from .transcription import transcribe_audio_segment
+from .transcription import transcribe_waveforms
 
 logger = get_logger()
 
+
+def _transcribe_segments(
+    audio_path: str,
+    speaker_segments: list[SpeakerSegment],
+    waveform: np.ndarray | None = None,
+    sample_rate: int | None = None,
+) -> list[str | None]:
+    """Transcribe every speaker segment of an audio file.
+
+    The file is decoded once, unless its decoded waveform is given, and the
+    segments are transcribed together by `transcribe_waveforms`.
+
+    :param audio_path: Path to the audio file.
+    :param speaker_segments: Segments to transcribe.
+    :param waveform: Optional decoded 16 kHz mono waveform of the file.
+    :param sample_rate: Sample rate of `waveform`.
+    :return: The transcript of each segment, or `None` where it failed.
+    """
+    if waveform is not None:
+        sample_rate = sample_rate or SAMPLE_RATE
+    else:
+        try:
+            waveform, sample_rate = load_cached_waveform(audio_path)
+        except Exception:
+            logger.exception("Error decoding audio file {}", audio_path)
+            return [None] * len(speaker_segments)
+    return transcribe_waveforms([
+        waveform[int(seg.start_time * sample_rate):int(seg.end_time * sample_rate)]
+        for seg in speaker_segments
+    ])
+
+
 def get_speaker_speech_data(data: GetSpeakerSpeechDataInput) -> SpeakerSpeechData:
     """Process speaker segments and transcribe speech data for each speaker.
 
@@ -36,39 +72,41 @@ def get_speaker_speech_data(data: GetSpeakerSpeechDataInput) -> SpeakerSpeechDat
     speaker_segments = data.speaker_segments
     audio_path = data.audio_file
     speaker_speech_data = {}
+    # Transcripts are collected per speaker and joined once at the end, since
+    # appending to one growing string copies it on every segment
+    speaker_speech = {}
 
-    logger.info("Starting speaker speech data processing for file: %s", audio_path)
+    logger.info("Starting speaker speech data processing for file: {}", audio_path)
 
-    for seg in speaker_segments:
+    transcripts = _transcribe_segments(
+        audio_path, speaker_segments, data.waveform, data.sample_rate)
 
-        logger.info("Processing segment: speaker=%s, start_time=%.2f, end_time=%.2f",
-                    seg.speaker, seg.start_time, seg.end_time)
-
-        try:
-            transcript_input = TranscribeAudioSegmentInput(
-                audio_file=audio_path, start_time=seg.start_time, end_time=seg.end_time,
-            )
-            transcript = transcribe_audio_segment(transcript_input).transcription
-            word_count = len(transcript.split())
-            logger.info("Transcription successful for speaker %s: %d words",
-            seg.speaker, word_count)
-        except Exception:
-            logger.exception("Error transcribing segment for speaker %s", seg.speaker)
+    # Per-segment progress is summarized in one line instead of several
+    # log records per segment
+    for seg, transcript in zip(speaker_segments, transcripts, strict=True):
+        if transcript is None:
             continue
+        word_count = len(transcript.split())
 
         # Store words spoken and duration
         if seg.speaker not in speaker_speech_data:
             speaker_speech_data[seg.speaker] = SpeechData(
                 length=word_count,
                 time_period=seg.end_time - seg.start_time,
-                speech=transcript,
+                speech="",
             )
-            logger.info("Created new speech data entry for speaker: %s", seg.speaker)
+            speaker_speech[seg.speaker] = [transcript]
         else:
             speaker_speech_data[seg.speaker].length += word_count
             speaker_speech_data[seg.speaker].time_period+= seg.end_time - seg.start_time
-            speaker_speech_data[seg.speaker].speech += " " + transcript
-            logger.info("Updated speech data for speaker: %s", seg.speaker)
+            speaker_speech[seg.speaker].append(transcript)
+
+    for speaker, transcripts_of_speaker in speaker_speech.items():
+        speaker_speech_data[speaker].speech = " ".join(transcripts_of_speaker)
 
-    logger.info("Completed processing of speaker speech data for file: %s", audio_path)
+    failed = transcripts.count(None)
+    logger.info(
+        "Processed {} segments for {} speakers ({} failed) in file: {}",
+        len(speaker_segments), len(speaker_speech_data), failed, audio_path,
+    )
     return SpeakerSpeechData(speaker_speech_data=speaker_speech_data)
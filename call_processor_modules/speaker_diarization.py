@@ -7,16 +7,21 @@ first token.
 
 Functions:
     - raise_error: Helper function to raise a ValueError with a custom message.
+    - get_pipeline: Loads the pyannote pipeline once per process.
     - diarize: Performs speaker diarization on the provided audio file,
       identifies speakers, and computes speaker-related metrics.
 """
 
 import os
+from functools import lru_cache
 
+import numpy as np
 import torch
 from dotenv import load_dotenv
 from pyannote.audio import Pipeline
+from whisper.audio import SAMPLE_RATE
 
+from call_processor_modules.audio import load_cached_waveform
 from call_processor_modules.pydantic_models import (
     DiarizeInput,
     DiarizeOutput,
@@ -31,6 +36,20 @@ def raise_error(message: str) -> None:
     """Raise a ValueError with the given message."""
     raise ValueError(message)
 
+@lru_cache(maxsize=1)
+def get_pipeline(token: str) -> Pipeline:
+    """Load the diarization pipeline on first use and reuse it afterwards.
+
+    :param token: Hugging Face token used to download the pipeline.
+    :return: The process-wide pipeline, moved to the GPU when available.
+    """
+    pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization",
+                                        use_auth_token=token)
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    pipeline.to(device)
+    logger.info("Pipeline loaded and moved to {}", device)
+    return pipeline
+
 def diarize(data: DiarizeInput) -> DiarizeOutput:
     """Perform speaker diarization on the given audio file.
 
@@ -53,20 +72,26 @@ def diarize(data: DiarizeInput) -> DiarizeOutput:
 
     try:
         audio_file = data.audio_file
-        logger.info("Starting speaker diarization for file: {audio_file}")
+        logger.info("Starting speaker diarization for file: {}", audio_file)
 
         token = os.getenv("HUGGING_FACE_TOKEN")
         if not token:
             error_text = "Hugging Face token not found in environment variables."
             raise_error(error_text)
 
-        pipeline = Pipeline.from_pretrained("pyannote/speaker-diarization",
-                                            use_auth_token=token)
-        device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        pipeline.to(device)
-        logger.info("Pipeline loaded and moved to {device}")
+        pipeline = get_pipeline(token)
 
-        diarization = pipeline(audio_file)
+        # Always hand pyannote an in-memory waveform: either the caller's or
+        # the shared cached decode that segment transcription reuses later,
+        # so the pipeline never reads and decodes the file itself
+        if data.waveform is not None:
+            waveform, sample_rate = data.waveform, data.sample_rate or SAMPLE_RATE
+        else:
+            waveform, sample_rate = load_cached_waveform(audio_file)
+        diarization = pipeline({
+            "waveform": torch.from_numpy(waveform).unsqueeze(0),
+            "sample_rate": sample_rate,
+        })
         speaker_segments = []
 
         for turn, _, speaker in diarization.itertracks(yield_label=True):
@@ -76,42 +101,50 @@ def diarize(data: DiarizeInput) -> DiarizeOutput:
                 end_time=turn.end,
             ))
 
-        logger.info("Identified {len(speaker_segments)} speaker segments")
+        logger.info("Identified {} speaker segments", len(speaker_segments))
 
-        # Compute metrics
+        # Compute metrics over the segments as arrays
         total_time = {}
         interruptions = 0
         first_speaker_time = None
-        prev_speaker = None
-        prev_end_time = 0
-
-        for segment in speaker_segments:
-            start, end, speaker = segment.start_time, segment.end_time, segment.speaker
-            duration = end - start
-            total_time[speaker] = total_time.get(speaker, 0) + duration
-
-            if prev_speaker and prev_speaker != speaker and start < prev_end_time:
-                interruptions += 1
-
-            if first_speaker_time is None:
-                first_speaker_time = start
 
-            prev_speaker = speaker
-            prev_end_time = end
+        if speaker_segments:
+            count = len(speaker_segments)
+            starts = np.fromiter(
+                (segment.start_time for segment in speaker_segments), float, count)
+            ends = np.fromiter(
+                (segment.end_time for segment in speaker_segments), float, count)
+            labels = np.array([segment.speaker for segment in speaker_segments])
+
+            # Speaking time per speaker, in order of first appearance
+            speakers, first_index, inverse = np.unique(
+                labels, return_index=True, return_inverse=True)
+            totals = np.bincount(inverse, weights=ends - starts)
+            order = np.argsort(first_index)
+            total_time = dict(
+                zip(speakers[order].tolist(), totals[order].tolist(), strict=True))
+
+            # A segment interrupts when it starts before the previous segment,
+            # spoken by someone else, has ended
+            interruptions = int(
+                ((labels[1:] != labels[:-1]) & (starts[1:] < ends[:-1])).sum())
+            first_speaker_time = float(starts[0])
         least_len = 2
         if len(total_time) >= least_len:
-            speakers = list(total_time.keys())
-            speaking_ratio = total_time[speakers[0]] / total_time[speakers[1]]
+            # Ratio of the two longest speaking times, whatever the order in
+            # which speakers first appear or how many of them there are
+            second, first = np.sort(np.fromiter(total_time.values(), float))[-2:]
+            speaking_ratio = float(first / second)
         else:
             speaking_ratio = "N/A (only one speaker detected)"
             logger.warning("Only One Speaker Detected")
 
-        logger.warning("Speaking ratio: {speaking_ratio}")
-        logger.info("Interruptions count: {interruptions}")
-        logger.info("Time to first token: {first_speaker_time or 0.0}")
+        logger.warning("Speaking ratio: {}", speaking_ratio)
+        logger.info("Interruptions count: {}", interruptions)
+        logger.info("Time to first token: {}", first_speaker_time or 0.0)
 
     except Exception:
-        logger.exception("Error in speaker Diarization : {e!s}")
+        logger.exception("Error in speaker diarization")
 
     return DiarizeOutput(
         speaker_segments=speaker_segments,
@@ -30,7 +30,7 @@ def calculate_speaking_speed(
             for speaker, data in speaker_speech_data.items()
         }
 
-        logger.info("Calculated Speaking Speeds: {speaking_speeds}")
+        logger.info("Calculated Speaking Speeds: {}", speaking_speeds)
 
         return CalculateSpeakingSpeedOutput(speaking_speeds=speaking_speeds)
 
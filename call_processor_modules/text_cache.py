@@ -0,0 +1,53 @@
+"""Module for memoizing text analyses per transcript.
+
+The text analyses are pure functions of the transcribed text, and the same
+transcript is analysed again whenever a menu choice or the summary table
+reuses it. `memoize_per_text` keeps the most recent results of an analysis
+in memory, keyed on the raw text only, so repeated checks skip the work.
+
+Only the pure computation should be memoized; callers log around the
+memoized function so that every check is logged, including cache hits.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import ParamSpec, TypeVar
+
+ParamT = ParamSpec("ParamT")
+ResultT = TypeVar("ResultT")
+
+# Number of transcripts whose results are kept per analysis
+TEXT_CACHE_SIZE = 256
+
+
+def memoize_per_text(
+    analyse: Callable[ParamT, ResultT],
+) -> Callable[ParamT, ResultT]:
+    """Memoize a text analysis on its positional arguments.
+
+    Keyword arguments are passed through on a miss but are not part of the
+    cache key, so derived inputs such as a lowercased copy of the text do not
+    keep a second copy of every transcript alive.
+
+    :param analyse: Function taking the raw text as first argument.
+    :return: The memoized function.
+    """
+    cache: OrderedDict[tuple, ResultT] = OrderedDict()
+    lock = threading.Lock()
+
+    @wraps(analyse)
+    def memoized(*args: ParamT.args, **kwargs: ParamT.kwargs) -> ResultT:
+        with lock:
+            if args in cache:
+                cache.move_to_end(args)
+                return cache[args]
+        result = analyse(*args, **kwargs)
+        with lock:
+            cache[args] = result
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    return memoized
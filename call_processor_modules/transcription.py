@@ -1,16 +1,26 @@
 """Module for transcribing audio segments using a specified transcription model.
 
 This module processes audio files, extracts the required segments, and
-performs transcription, returning the transcribed text.
+performs transcription, returning the transcribed text. A single segment is
+read straight from its frames in the file, whole files are decoded once into
+memory, and an already decoded waveform can be passed instead of reading the
+file again.
 
 The `transcribe_audio_segment` function extracts an audio segment from the
 provided file based on the specified start and end times (if available),
 performs transcription, and returns the resulting text.
+`transcribe_audio_segments_batch` does the same for many segments at once
+through `transcribe_waveforms`, which transcribes decoded waveforms of any
+length; `transcribe_batch` transcribes many short waveforms in one batched
+decoding pass.
 """
 
-from pathlib import Path
+import threading
 
-from pydub import AudioSegment
+import numpy as np
+import torch
+from whisper import DecodingOptions, decode
+from whisper.audio import N_SAMPLES, SAMPLE_RATE, log_mel_spectrogram, pad_or_trim
 
 from call_processor_modules.pydantic_models import (
     TranscribeAudioSegmentInput,
@@ -18,10 +28,18 @@ from call_processor_modules.pydantic_models import (
 )
 from logger_config import get_logger
 
-from . import model
+from . import get_model
+from .audio import load_cached_waveform, load_segment
 
 logger = get_logger()
 
+# Whisper installs decoding hooks on the shared model for every call, so only
+# one thread may run inference at a time
+_model_lock = threading.Lock()
+
+# Number of short waveforms transcribed by one batched Whisper decode
+BATCH_SIZE = 16
+
 
 def transcribe_audio_segment(
     data: TranscribeAudioSegmentInput) -> TranscribeAudioSegmentOutput:
@@ -38,34 +56,13 @@ def transcribe_audio_segment(
     :rtype: TranscribeAudioSegmentOutput
     """
     try:
-        logger.info("Starting transcription for file: {data.audio_file}")
-
-        # Load audio file
-        audio = AudioSegment.from_file(data.audio_file)
-
-        # Extract segment if start and end times are provided
-        if data.start_time and data.end_time:
-            segment = audio[data.start_time * 1000:data.end_time * 1000]
-            logger.info("Extracted segment from {data.start_time}s to {data.end_time}s")
-        else:
-            segment = audio
-            logger.info("Using full audio file for transcription.")
-
-        # Export segment as a temporary WAV file
-        temp_wav_path = "temp_segment.wav"
-        segment.export(temp_wav_path, format="wav")
-        logger.info("Temporary WAV file created: {temp_wav_path}")
-
-        # Perform transcription
-        result = model.transcribe(temp_wav_path)
+        logger.info("Starting transcription for file: {}", data.audio_file)
 
-        # Remove temporary file
-        Path.unlink(temp_wav_path)
-        logger.info("Temporary file deleted: {temp_wav_path}")
+        result = _transcribe_waveform(_segment_waveform(data))
 
         # Extract transcription result
         transcription = result["text"]
-        logger.info("Transcription successful: {transcription[:50]}...")
+        logger.info("Transcription successful: {}...", transcription[:50])
 
         return TranscribeAudioSegmentOutput(transcription=transcription)
 
@@ -74,3 +71,128 @@ def transcribe_audio_segment(
         return TranscribeAudioSegmentOutput(transcription="False")
 
 
+def transcribe_audio_segments_batch(
+    inputs: list[TranscribeAudioSegmentInput],
+) -> list[TranscribeAudioSegmentOutput]:
+    """Transcribe several audio segments, batching the short ones.
+
+    The segments are read and handed to `transcribe_waveforms`. As with
+    `transcribe_audio_segment`, a segment that cannot be read or transcribed
+    is reported as "False".
+
+    :param inputs: Audio segments to transcribe.
+    :return: The transcription of each segment, in order.
+    """
+    waveforms: list[np.ndarray | None] = []
+    for data in inputs:
+        try:
+            waveforms.append(_segment_waveform(data))
+        except Exception:
+            logger.exception("Error reading audio file {}", data.audio_file)
+            waveforms.append(None)
+    transcripts = transcribe_waveforms(waveforms)
+
+    logger.info(
+        "Transcribed {} segments ({} failed)",
+        len(inputs), transcripts.count(None),
+    )
+    return [
+        TranscribeAudioSegmentOutput(
+            transcription="False" if transcript is None else transcript,
+        )
+        for transcript in transcripts
+    ]
+
+
+def transcribe_waveforms(
+    waveforms: list[np.ndarray | None],
+) -> list[str | None]:
+    """Transcribe decoded 16 kHz mono waveforms, batching the short ones.
+
+    Waveforms that fit in one 30 second Whisper window are transcribed
+    `BATCH_SIZE` at a time with `transcribe_batch`; longer waveforms go
+    through the regular windowed transcription.
+
+    :param waveforms: Waveforms to transcribe; `None` marks a missing one.
+    :return: The transcript of each waveform, or `None` where it is missing
+             or transcribing it failed.
+    """
+    transcripts: list[str | None] = [None] * len(waveforms)
+
+    short = [
+        index for index, waveform in enumerate(waveforms)
+        if waveform is not None and len(waveform) <= N_SAMPLES
+    ]
+    for batch_start in range(0, len(short), BATCH_SIZE):
+        batch = short[batch_start:batch_start + BATCH_SIZE]
+        try:
+            texts = transcribe_batch([waveforms[index] for index in batch])
+        except Exception:
+            logger.exception("Error transcribing a batch of {} waveforms", len(batch))
+            continue
+        for index, text in zip(batch, texts, strict=True):
+            transcripts[index] = text
+
+    for index, waveform in enumerate(waveforms):
+        if waveform is not None and len(waveform) > N_SAMPLES:
+            try:
+                transcripts[index] = _transcribe_waveform(waveform)["text"]
+            except Exception:
+                logger.exception("Error during transcription")
+
+    return transcripts
+
+
+def _segment_waveform(data: TranscribeAudioSegmentInput) -> np.ndarray:
+    """Return the waveform of the segment described by a transcription input."""
+    start_time, end_time = data.start_time, data.end_time
+    if data.waveform is not None:
+        waveform, sample_rate = data.waveform, data.sample_rate or SAMPLE_RATE
+    elif start_time and end_time:
+        waveform, _ = load_segment(data.audio_file, start_time, end_time)
+        logger.info("Read segment from {}s to {}s", start_time, end_time)
+        return waveform
+    else:
+        waveform, sample_rate = load_cached_waveform(data.audio_file)
+
+    # Extract segment if start and end times are provided
+    if start_time and end_time:
+        logger.info("Extracted segment from {}s to {}s", start_time, end_time)
+        return waveform[int(start_time * sample_rate):int(end_time * sample_rate)]
+    logger.info("Using full waveform for transcription.")
+    return waveform
+
+
+def _transcribe_waveform(waveform: np.ndarray) -> dict:
+    """Transcribe a decoded waveform of any length."""
+    with _model_lock:
+        return get_model().transcribe(waveform)
+
+
+def transcribe_batch(waveforms: list[np.ndarray]) -> list[str]:
+    """Transcribe several short waveforms with a single batched decode.
+
+    Each waveform must be 16 kHz mono and at most 30 seconds long, the size of
+    one Whisper window. The waveforms are padded to a full window and their
+    log-Mel spectrograms are stacked, so the encoder and decoder run once for
+    the whole batch instead of once per waveform.
+
+    :param waveforms: Waveforms to transcribe.
+    :return: The transcribed text of each waveform, in order.
+    """
+    model = get_model()
+    mels = torch.stack([
+        log_mel_spectrogram(
+            pad_or_trim(torch.from_numpy(waveform)),
+            model.dims.n_mels,
+            device=model.device,
+        )
+        for waveform in waveforms
+    ])
+    # Half precision is only supported on GPU
+    options = DecodingOptions(
+        fp16=model.device.type == "cuda", without_timestamps=True,
+    )
+    with _model_lock:
+        results = decode(model, mels, options)
+    return [result.text.strip() for result in results]
@@ -9,6 +9,7 @@ Features:
 - Loads logging configuration from a TOML file.
 - Creates the log directory if it doesn't exist.
 - Configures `loguru` with a custom log format, rotation, compression, and log level.
+- Writes log records from a background queue so callers never block on disk I/O.
 - Provides a `get_logger` function to retrieve the configured logger instance.
 
 Usage:
@@ -63,8 +64,12 @@ logger.add(
     rotation=log_config["log_rotation"],
     compression=log_config["log_compression"],
     level=log_config["min_log_level"],
-    backtrace=True,
-    diagnose=True,
+    # Records are written by a background worker instead of the logging thread
+    enqueue=True,
+    # Extended tracebacks walk every frame and dump local variables, which is
+    # slow and can write transcript contents into the log
+    backtrace=False,
+    diagnose=False,
 )
 
 def get_logger() -> logger:
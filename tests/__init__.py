@@ -0,0 +1 @@
+"""Tests for the call processing modules."""
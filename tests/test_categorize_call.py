@@ -0,0 +1,44 @@
+"""Tests for keyword counting in call categorization."""
+
+from call_processor_modules import categories
+from call_processor_modules.categorize_call import categorize, count_categories
+from call_processor_modules.pydantic_models import CategorizeInput
+
+
+def category_counts(text: str) -> dict[str, int]:
+    """Count keyword matches per category in lowercased text."""
+    return dict(zip(categories, count_categories(text.lower()), strict=True))
+
+
+def test_nested_keyword_counts_towards_both_categories() -> None:
+    """'subscription' inside 'cancel subscription' still counts for Billing."""
+    counts = category_counts("I want to cancel subscription today")
+
+    assert counts["Billing Issues"] == 1
+    assert counts["Cancellation Requests"] == 1
+
+
+def test_shared_keyword_counts_towards_every_category() -> None:
+    """A keyword listed in two categories counts once in each."""
+    counts = category_counts("Why is there a cancellation fee?")
+
+    assert counts["Billing Issues"] == 1
+    assert counts["Cancellation Requests"] == 1
+
+
+def test_longest_keyword_wins_within_a_category() -> None:
+    """Within one category a multi-word keyword is counted once."""
+    counts = category_counts("There was a late fee after a failed payment")
+
+    assert counts["Billing Issues"] == 2
+
+
+def test_categorize_picks_most_counted_category() -> None:
+    """Nested keywords add to the category they belong to."""
+    result = categorize(
+        CategorizeInput(
+            transcribed_text="Cancel subscription, the invoice shows a late fee",
+        ),
+    )
+
+    assert result.category == "Billing Issues"
@@ -1,58 +1,118 @@
-"""Text-based User Interface (TUI) for speech analysis."""
+"""Text-based User Interface (TUI) for speech analysis.
+
+The processing modules load Whisper, pyannote and the text analyzers, so each
+one is imported on first use rather than at startup; the menu appears at once
+and only the features that are run pay for their imports.
+"""
+import glob
+import io
 import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parent.parent))
 import warnings
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TypeVar
 
+import numpy as np
 import questionary
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from call_processor_modules import (
-    categorize_call,
-    pii_check,
-    profanity_check,
-    sentiment_analysis,
-    speaker_diarization,
-    speaker_speed,
-    transcription,
-)
-from call_processor_modules.required_phrases_check import (
-    CheckRequiredPhrasesInput,
-    check_required_phrases,
-)
-from call_processor_modules.speaker import (
-    GetSpeakerSpeechDataInput,
-    get_speaker_speech_data,
-)
-
-# Suppress all warnings
-warnings.filterwarnings("ignore")
+if TYPE_CHECKING:
+    from call_processor_modules.pydantic_models import (
+        TranscribeAudioSegmentOutput,
+    )
 
 console = Console()
 
+ResultT = TypeVar("ResultT")
+
+
+class LoadedAudio(NamedTuple):
+    """An audio file decoded once for all models, and its cache key.
+
+    Models decode the file themselves when no waveform is given, and nothing
+    is cached when no digest is given.
+    """
+
+    waveform: np.ndarray | None = None
+    sample_rate: int | None = None
+    digest: str | None = None
+
+
+NO_AUDIO = LoadedAudio()
+
+
+def _cached_result(
+    audio_digest: str | None,
+    name: str,
+    model: type[ResultT],
+    compute: Callable[[], ResultT],
+    cacheable: Callable[[ResultT], bool],
+) -> ResultT:
+    """Return a model result from the on-disk cache, computing it on a miss.
 
-def display_transcription(audio_file_path: str) -> None:
+    Nothing is cached when no audio digest is given.
+    """
+    from call_processor_modules.result_cache import load_result, store_result
+
+    if audio_digest is not None:
+        cached = load_result(audio_digest, name, model)
+        if cached is not None:
+            return cached
+    result = compute()
+    if audio_digest is not None and cacheable(result):
+        store_result(audio_digest, name, result)
+    return result
+
+
+def display_transcription(
+    audio_file_path: str,
+    out: Console = console,
+    audio: LoadedAudio = NO_AUDIO,
+) -> None:
     """Display the transcription of the audio file."""
-    console.print(Panel.fit("[bold cyan]--- Running Transcription ---[/bold cyan]"))
+    from call_processor_modules import transcription
+
+    out.print(Panel.fit("[bold cyan]--- Running Transcription ---[/bold cyan]"))
     transcription_input = transcription.TranscribeAudioSegmentInput(
         audio_file=audio_file_path,
+        waveform=audio.waveform,
+        sample_rate=audio.sample_rate,
+    )
+    # Failed transcriptions are reported as "False" and must not be cached
+    full_transcription = _cached_result(
+        audio.digest, "transcription", transcription.TranscribeAudioSegmentOutput,
+        lambda: transcription.transcribe_audio_segment(transcription_input),
+        lambda result: result.transcription != "False",
     )
-    full_transcription = transcription.transcribe_audio_segment(transcription_input)
-    console.print(f"[bold]Transcription:[/bold]\n{full_transcription.transcription}")
+    out.print(f"[bold]Transcription:[/bold]\n{full_transcription.transcription}")
     return full_transcription
 
 
-def display_diarization(audio_file_path: str) -> tuple:
+def display_diarization(
+    audio_file_path: str,
+    out: Console = console,
+    audio: LoadedAudio = NO_AUDIO,
+) -> tuple:
     """Display the diarization results of the audio file."""
-    console.print(
+    from call_processor_modules import speaker_diarization
+
+    out.print(
         Panel.fit("[bold cyan]--- Running Speaker Diarization ---[/bold cyan]"),
     )
-    diarization_input = speaker_diarization.DiarizeInput(audio_file=audio_file_path)
-    diarization_results = speaker_diarization.diarize(diarization_input)
-    console.print("[bold]Diarization Results:[/bold]\n")
+    diarization_input = speaker_diarization.DiarizeInput(
+        audio_file=audio_file_path,
+        waveform=audio.waveform,
+        sample_rate=audio.sample_rate,
+    )
+    diarization_results = _cached_result(
+        audio.digest, "diarization", speaker_diarization.DiarizeOutput,
+        lambda: speaker_diarization.diarize(diarization_input),
+        lambda result: bool(result.speaker_segments),
+    )
+    out.print("[bold]Diarization Results:[/bold]\n")
 
     # Display speaker segments in a table
     segments_table = Table(
@@ -69,7 +129,7 @@ def display_diarization(audio_file_path: str) -> tuple:
             f"{segment.end_time:.2f}",
             segment.speaker,
         )
-    console.print(segments_table)
+    out.print(segments_table)
 
     # Display metrics in a table
     metrics_table = Table(
@@ -91,97 +151,211 @@ def display_diarization(audio_file_path: str) -> tuple:
         "Time to First Token (TTFT)",
         f"{diarization_results.time_to_first_token:.2f}s",
     )
-    console.print(metrics_table)
+    out.print(metrics_table)
     return diarization_results
 
 
 def display_speaker_speed(
-    audio_file_path: str, diarization_results: tuple,
+    audio_file_path: str,
+    diarization_results: tuple,
+    out: Console = console,
+    audio: LoadedAudio = NO_AUDIO,
 ) -> tuple:
     """Display the speaking speed analysis of the audio file."""
-    console.print(
+    from call_processor_modules import speaker_speed
+    from call_processor_modules.speaker import (
+        GetSpeakerSpeechDataInput,
+        SpeakerSpeechData,
+        get_speaker_speech_data,
+    )
+
+    out.print(
         Panel.fit("[bold cyan]--- Running Speaker Speed Analysis ---[/bold cyan]"),
     )
     speech_data_input = GetSpeakerSpeechDataInput(
         audio_file=audio_file_path,
         speaker_segments=diarization_results.speaker_segments,
+        waveform=audio.waveform,
+        sample_rate=audio.sample_rate,
+    )
+    speaker_speech_data = _cached_result(
+        audio.digest, "speaker_speech_data", SpeakerSpeechData,
+        lambda: get_speaker_speech_data(speech_data_input),
+        lambda result: bool(result.speaker_speech_data),
     )
-    speaker_speech_data = get_speaker_speech_data(speech_data_input)
     speed_results = speaker_speed.calculate_speaking_speed(speaker_speech_data)
     speed_table = Table(title="Speaker Speeds")
     speed_table.add_column("Speaker", style="cyan")
     speed_table.add_column("Speed (words per minute)", style="magenta")
     for speaker, speed in speed_results.speaking_speeds.items():
         speed_table.add_row(speaker, f"{speed:.2f}")
-    console.print(speed_table)
+    out.print(speed_table)
     return speaker_speech_data, speed_results
 
 
-def display_pii_check(transcription_text: str) -> None:
+def display_pii_check(
+    transcription_text: str, out: Console = console,
+) -> None:
     """Display the PII check results."""
-    console.print(Panel.fit("[bold cyan]--- Running PII Check ---[/bold cyan]"))
+    from call_processor_modules import pii_check
+
+    out.print(Panel.fit("[bold cyan]--- Running PII Check ---[/bold cyan]"))
     pii_data_input = pii_check.CheckPIIInput(transcribed_text=transcription_text)
     pii_results = pii_check.check_pii(pii_data_input)
-    console.print(
+    out.print(
         f"[bold]PII Detected:[/bold] {pii_results.detected}\n"
         f"[bold]Masked Text:[/bold]\n{pii_results.masked_text}",
     )
 
 
-def display_profanity_check(transcription_text: str) -> None:
+def display_profanity_check(
+    transcription_text: str, out: Console = console,
+) -> None:
     """Display the profanity check results."""
-    console.print(Panel.fit("[bold cyan]--- Running Profanity Check ---[/bold cyan]"))
+    from call_processor_modules import profanity_check
+
+    out.print(Panel.fit("[bold cyan]--- Running Profanity Check ---[/bold cyan]"))
     profanity_input_data = profanity_check.CheckProfanityInput(
         transcribed_text=transcription_text,
     )
     profanity_results = profanity_check.check_profanity(profanity_input_data)
-    console.print(
+    out.print(
         f"[bold]Profanity Detected:[/bold] {profanity_results.detected}\n"
         f"[bold]Censored Text:[/bold]\n{profanity_results.censored_text}",
     )
 
 
-def display_required_phrases_check(transcription_text: str) -> None:
+def display_required_phrases_check(
+    transcription_text: str, out: Console = console,
+) -> None:
     """Display the required phrases check results."""
-    console.print(
+    from call_processor_modules.required_phrases_check import (
+        CheckRequiredPhrasesInput,
+        check_required_phrases,
+    )
+
+    out.print(
         Panel.fit("[bold cyan]--- Running Required Phrases Check ---[/bold cyan]"),
     )
     phrases_input_data = CheckRequiredPhrasesInput(transcribed_text=transcription_text)
     phrases_results = check_required_phrases(phrases_input_data)
-    console.print(
-        f"[bold]Required Phrases Present:[/bold] "
-        f"{phrases_results.required_phrases_present}\n"
-        f"[bold]Phrases:[/bold] "
-        f"{phrases_results.present_phrases
-        if phrases_results.required_phrases_present else 'N/A'}",
+    present = phrases_results.required_phrases_present
+    present_phrases = phrases_results.present_phrases if present else "N/A"
+    out.print(
+        f"[bold]Required Phrases Present:[/bold] {present}\n"
+        f"[bold]Phrases:[/bold] {present_phrases}",
     )
 
 
-def display_sentiment_analysis(transcription_text: str) -> None:
+def display_sentiment_analysis(
+    transcription_text: str, out: Console = console,
+) -> None:
     """Display the sentiment analysis results."""
-    console.print(Panel.fit(
+    from call_processor_modules import sentiment_analysis
+
+    out.print(Panel.fit(
     "[bold cyan]--- Running Sentiment Analysis ---[/bold cyan]"))
     sentiment_input_data = sentiment_analysis.AnalyseSentimentInput(
         transcribed_text=transcription_text,
     )
     sentiment_results = sentiment_analysis.analyse_sentiment(sentiment_input_data)
-    console.print(
+    out.print(
         f"[bold]Polarity:[/bold] {sentiment_results.polarity}\n"
         f"[bold]Subjectivity:[/bold] {sentiment_results.subjectivity}\n"
         f"[bold]Overall Sentiment:[/bold] {sentiment_results.overall_sentiment}",
     )
 
 
-def display_call_categorization(transcription_text: str) -> None:
+def display_call_categorization(
+    transcription_text: str, out: Console = console,
+) -> None:
     """Display the call categorization results."""
-    console.print(
+    from call_processor_modules import categorize_call
+
+    out.print(
         Panel.fit("[bold cyan]--- Running Call Categorization ---[/bold cyan]"),
     )
     category_input_data = categorize_call.CategorizeInput(
         transcribed_text=transcription_text,
     )
     category = categorize_call.categorize(category_input_data)
-    console.print(f"[bold]Call Category:[/bold] {category}")
+    out.print(f"[bold]Call Category:[/bold] {category}")
+
+
+# Speakers compared side by side in the summary table
+SUMMARY_SPEAKERS = ("SPEAKER_00", "SPEAKER_01")
+SUMMARY_ROWS = (
+    "Speech Data",
+    "Speaking Speed (WPM)",
+    "PII Check",
+    "Profanity Check",
+    "Required Phrases",
+    "Sentiment Analysis",
+)
+
+
+def _analyze_speaker(text: str) -> dict:
+    """Run the text analyses of the summary table on one speaker's speech."""
+    from call_processor_modules import (
+        pii_check,
+        profanity_check,
+        sentiment_analysis,
+    )
+    from call_processor_modules.required_phrases_check import (
+        CheckRequiredPhrasesInput,
+        check_required_phrases,
+    )
+
+    if not text:
+        return {}
+    return {
+        "pii": pii_check.check_pii(pii_check.CheckPIIInput(transcribed_text=text)),
+        "profanity": profanity_check.check_profanity(
+            profanity_check.CheckProfanityInput(transcribed_text=text)),
+        "phrases": check_required_phrases(
+            CheckRequiredPhrasesInput(transcribed_text=text)),
+        "sentiment": sentiment_analysis.analyse_sentiment(
+            sentiment_analysis.AnalyseSentimentInput(transcribed_text=text)),
+    }
+
+
+def _summary_cells(
+    speaker_data: object, speaking_speed: object, analysis: dict,
+) -> tuple[str, ...]:
+    """Format one speaker's column of the summary table, in `SUMMARY_ROWS` order."""
+    # Each result is looked up once and its cell text built from locals
+    length, time_period = (
+        (speaker_data.length, speaker_data.time_period) if speaker_data
+        else ("N/A", "N/A")
+    )
+    pii = analysis.get("pii")
+    pii_detected = pii.detected if pii else "N/A"
+    profanity = analysis.get("profanity")
+    profanity_detected = profanity.detected if profanity else "N/A"
+
+    phrases = analysis.get("phrases")
+    if phrases:
+        present = phrases.required_phrases_present
+        present_phrases = phrases.present_phrases if present else "N/A"
+        phrases_cell = f"Present: {present}\nPhrases: {present_phrases}"
+    else:
+        phrases_cell = "N/A"
+
+    sentiment = analysis.get("sentiment")
+    polarity, subjectivity, overall = (
+        (sentiment.polarity, sentiment.subjectivity, sentiment.overall_sentiment)
+        if sentiment
+        else ("N/A", "N/A", "N/A")
+    )
+
+    return (
+        f"Length: {length}\nTime: {time_period}",
+        f"{speaking_speed}",
+        f"Detected: {pii_detected}",
+        f"Detected: {profanity_detected}",
+        phrases_cell,
+        f"Polarity: {polarity}\nSubjectivity: {subjectivity}\nOverall: {overall}",
+    )
 
 
 def display_summary_table(
@@ -200,171 +374,356 @@ def display_summary_table(
     summary_table.add_column("Speaker 2", style="green")
 
     # Extract speaker-specific data
-    speaker_1_data = speaker_speech_data.speaker_speech_data.get("SPEAKER_00", None)
-    speaker_2_data = speaker_speech_data.speaker_speech_data.get("SPEAKER_01", None)
-
-    # Add Speech Data row
-    summary_table.add_row(
-        "Speech Data",
-        f"Length: {speaker_1_data.length if speaker_1_data else 'N/A'}\n"
-        f"Time: {speaker_1_data.time_period if speaker_1_data else 'N/A'}",
-        f"Length: {speaker_2_data.length if speaker_2_data else 'N/A'}\n"
-        f"Time: {speaker_2_data.time_period if speaker_2_data else 'N/A'}",
-    )
-
-    # Add Speaking Speed row
-    summary_table.add_row(
-        "Speaking Speed (WPM)",
-        f"{speed_results.speaking_speeds.get('SPEAKER_00', 'N/A')}",
-        f"{speed_results.speaking_speeds.get('SPEAKER_01', 'N/A')}",
-    )
-
-    # Add PII Check row
-    pii_speaker_1 = (
-        pii_check.check_pii(
-            pii_check.CheckPIIInput(
-                transcribed_text=speaker_1_data.speech if speaker_1_data else "",
-            ),
-        )
-        if speaker_1_data
-        else None
-    )
-    pii_speaker_2 = (
-        pii_check.check_pii(
-            pii_check.CheckPIIInput(
-                transcribed_text=speaker_2_data.speech if speaker_2_data else "",
-            ),
-        )
-        if speaker_2_data
-        else None
-    )
-    summary_table.add_row(
-        "PII Check",
-        f"Detected: {pii_speaker_1.detected if pii_speaker_1 else 'N/A'}",
-        f"Detected: {pii_speaker_2.detected if pii_speaker_2 else 'N/A'}",
-    )
+    speakers_data = [
+        speaker_speech_data.speaker_speech_data.get(speaker)
+        for speaker in SUMMARY_SPEAKERS
+    ]
 
-    # Add Profanity Check row
-    profanity_speaker_1 = (
-        profanity_check.check_profanity(
-            profanity_check.CheckProfanityInput(
-                transcribed_text=speaker_1_data.speech if speaker_1_data else "",
-            ),
-        )
-        if speaker_1_data
-        else None
-    )
-    profanity_speaker_2 = (
-        profanity_check.check_profanity(
-            profanity_check.CheckProfanityInput(
-                transcribed_text=speaker_2_data.speech if speaker_2_data else "",
-            ),
+    # Analyze both speakers' speech at once, each in a single pass
+    with ThreadPoolExecutor(max_workers=len(SUMMARY_SPEAKERS)) as executor:
+        analyses = list(executor.map(
+            _analyze_speaker,
+            [data.speech if data else "" for data in speakers_data],
+        ))
+
+    columns = [
+        _summary_cells(
+            data, speed_results.speaking_speeds.get(speaker, "N/A"), analysis)
+        for speaker, data, analysis in zip(
+            SUMMARY_SPEAKERS, speakers_data, analyses, strict=True)
+    ]
+    for row in zip(SUMMARY_ROWS, *columns, strict=True):
+        summary_table.add_row(*row)
+
+    # Display the summary table
+    console.print(summary_table)
+
+
+TEXT_ANALYSES = (
+    display_pii_check,
+    display_profanity_check,
+    display_required_phrases_check,
+    display_sentiment_analysis,
+    display_call_categorization,
+)
+
+
+def _decode_audio(audio_file_path: str) -> tuple[np.ndarray, int] | None:
+    """Decode an audio file, printing the error instead when it fails.
+
+    :return: The decoded waveform and its sample rate, or None on failure.
+    """
+    from call_processor_modules.audio import load_waveform
+
+    try:
+        return load_waveform(audio_file_path)
+    except Exception as e:  # noqa: BLE001 - reported, then back to the menu
+        console.print(f"[bold red]Cannot decode {audio_file_path}:[/bold red] {e}")
+        return None
+
+
+def _run_captured(
+    display: Callable[..., ResultT], *args: object, **kwargs: object,
+) -> tuple[ResultT, str]:
+    """Run a display function on a recording console.
+
+    :return: The display function's result and its captured output.
+    """
+    recorder = Console(record=True, file=io.StringIO(), width=console.width)
+    result = display(*args, out=recorder, **kwargs)
+    return result, recorder.export_text(styles=console.is_terminal)
+
+
+def run_all(
+    audio_file_path: str,
+) -> "TranscribeAudioSegmentOutput | None":
+    """Run all analysis functions on a given audio file.
+
+    :return: The full transcription of the audio file, or None when the file
+             cannot be read or decoded.
+    """
+    from call_processor_modules.result_cache import file_digest, has_result
+
+    # Model results are cached on disk by audio content and model, so a
+    # repeated run of the same recording only decodes it when a result is
+    # missing
+    try:
+        audio_digest = file_digest(audio_file_path)
+    except OSError as e:
+        console.print(f"[bold red]Cannot read {audio_file_path}:[/bold red] {e}")
+        return None
+    audio = LoadedAudio(digest=audio_digest)
+    if not all(
+        has_result(audio_digest, name)
+        for name in ("transcription", "diarization", "speaker_speech_data")
+    ):
+        # Decode the file once and share the waveform with every model
+        decoded = _decode_audio(audio_file_path)
+        if decoded is None:
+            return None
+        audio = LoadedAudio(*decoded, digest=audio_digest)
+
+    # Every step starts as soon as its input is ready and its output is printed
+    # as soon as it finishes: transcription and diarization run concurrently,
+    # the text analyses start once the transcription is done and speaker speed
+    # once the diarization is done
+    results = {}
+    with ThreadPoolExecutor(max_workers=2 + len(TEXT_ANALYSES)) as executor:
+        pending = {
+            executor.submit(
+                _run_captured, display_transcription, audio_file_path, audio=audio,
+            ): "transcription",
+            executor.submit(
+                _run_captured, display_diarization, audio_file_path, audio=audio,
+            ): "diarization",
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = pending.pop(future)
+                results[step], output = future.result()
+                console.file.write(output)
+                if step == "transcription":
+                    for display in TEXT_ANALYSES:
+                        pending[executor.submit(
+                            _run_captured, display, results[step].transcription,
+                        )] = display.__name__
+                elif step == "diarization":
+                    pending[executor.submit(
+                        _run_captured, display_speaker_speed, audio_file_path,
+                        results[step], audio=audio,
+                    )] = "speaker_speed"
+
+    full_transcription = results["transcription"]
+    speaker_speech_data, speed_results = results["speaker_speed"]
+    display_summary_table(speaker_speech_data, speed_results)
+    return full_transcription
+
+
+def analyze_speaker_speed(audio_file_path: str) -> None:
+    """Diarize an audio file and display the speaking speed of its speakers."""
+    decoded = _decode_audio(audio_file_path)
+    if decoded is None:
+        return
+    audio = LoadedAudio(*decoded)
+    diarization_results = display_diarization(audio_file_path, audio=audio)
+    display_speaker_speed(audio_file_path, diarization_results, audio=audio)
+
+
+# Audio formats picked up when a directory is given for a batch run
+AUDIO_SUFFIXES = {".wav", ".mp3"}
+
+
+def _expand_audio_paths(pattern: str) -> list[str]:
+    """Return the audio files in a directory, or the files matching a glob."""
+    if Path(pattern).is_dir():
+        return sorted(
+            str(path) for path in Path(pattern).iterdir()
+            if path.suffix.lower() in AUDIO_SUFFIXES
         )
-        if speaker_2_data
-        else None
+    return sorted(glob.glob(pattern))  # noqa: PTH207 - user supplied pattern
+
+
+def _analyze_batch_text(text: str) -> tuple:
+    """Run the text analyses shown in the batch summary on one transcript."""
+    from call_processor_modules import (
+        categorize_call,
+        pii_check,
+        profanity_check,
+        sentiment_analysis,
     )
-    summary_table.add_row(
-        "Profanity Check",
-        f"Detected: {profanity_speaker_1.detected if profanity_speaker_1 else 'N/A'}",
-        f"Detected: {profanity_speaker_2.detected if profanity_speaker_2 else 'N/A'}",
+    from call_processor_modules.required_phrases_check import (
+        CheckRequiredPhrasesInput,
+        check_required_phrases,
     )
 
-    # Add Required Phrases Check row
-    phrases_speaker_1 = (
-        check_required_phrases(
-            CheckRequiredPhrasesInput(
-                transcribed_text=speaker_1_data.speech if speaker_1_data else "",
-            ),
-        )
-        if speaker_1_data
-        else None
-    )
-    phrases_speaker_2 = (
-        check_required_phrases(
-            CheckRequiredPhrasesInput(
-                transcribed_text=speaker_2_data.speech if speaker_2_data else "",
-            ),
-        )
-        if speaker_2_data
-        else None
-    )
-    required_phrases_speaker_1 = (
-        f"Present: {phrases_speaker_1.required_phrases_present}\n"
-        f"Phrases: {phrases_speaker_1.present_phrases
-        if phrases_speaker_1 and phrases_speaker_1.required_phrases_present else 'N/A'}"
-        if phrases_speaker_1
-        else "N/A"
-    )
-    required_phrases_speaker_2 = (
-        f"Present: {phrases_speaker_2.required_phrases_present}\n"
-        f"Phrases: {phrases_speaker_2.present_phrases
-        if phrases_speaker_2 and phrases_speaker_2.required_phrases_present else 'N/A'}"
-        if phrases_speaker_2
-        else "N/A"
-    )
-    summary_table.add_row(
-        "Required Phrases",
-        required_phrases_speaker_1,
-        required_phrases_speaker_2,
-    )
-
-    # Add Sentiment Analysis row
-    sentiment_speaker_1 = (
+    return (
+        categorize_call.categorize(
+            categorize_call.CategorizeInput(transcribed_text=text)),
         sentiment_analysis.analyse_sentiment(
-            sentiment_analysis.AnalyseSentimentInput(
-                transcribed_text=speaker_1_data.speech if speaker_1_data else "",
-            ),
-        )
-        if speaker_1_data
-        else None
+            sentiment_analysis.AnalyseSentimentInput(transcribed_text=text)),
+        pii_check.check_pii(pii_check.CheckPIIInput(transcribed_text=text)),
+        profanity_check.check_profanity(
+            profanity_check.CheckProfanityInput(transcribed_text=text)),
+        # The summary only shows whether any required phrase is present
+        check_required_phrases(
+            CheckRequiredPhrasesInput(transcribed_text=text, stop_at_first=True)),
+    )
+
+
+# Files decoded and transcribed together in one step of a batch run; with the
+# previous step still being diarized, at most two steps of decoded audio are
+# held in memory
+BATCH_FILES = 16
+
+
+def _decode_batch(audio_file_paths: list[str]) -> dict[str, tuple[np.ndarray, int]]:
+    """Decode the files of one batch step, skipping those that cannot be decoded."""
+    from call_processor_modules.audio import load_waveform
+
+    audio = {}
+    for audio_file_path in audio_file_paths:
+        try:
+            audio[audio_file_path] = load_waveform(audio_file_path)
+        except Exception as e:  # noqa: BLE001 - one bad file must not stop the batch
+            console.print(f"[bold red]Skipping {audio_file_path}:[/bold red] {e}")
+    return audio
+
+
+def run_batch(audio_file_paths: list[str]) -> None:
+    """Run transcription, diarization and text analyses on several files.
+
+    Files are processed `BATCH_FILES` at a time: each is decoded once and
+    short files are transcribed together in batched Whisper decodes. The
+    text analyses of a file start as soon as it is transcribed, and its
+    waveform is dropped once it is diarized. The results are shown in one
+    summary table.
+    """
+    from call_processor_modules import speaker_diarization, transcription
+
+    console.print(Panel.fit("[bold cyan]--- Running Batch Analysis ---[/bold cyan]"))
+    # Diarization and analysis futures of every file, in input order
+    file_results = {}
+    # pyannote does not batch across files, so diarize them concurrently on a
+    # pool of their own; the text analyses never wait behind a diarization
+    with (
+        ThreadPoolExecutor(max_workers=2) as diarize_executor,
+        ThreadPoolExecutor(max_workers=2) as analyse_executor,
+    ):
+        diarizing = []
+        for start in range(0, len(audio_file_paths), BATCH_FILES):
+            audio = _decode_batch(audio_file_paths[start:start + BATCH_FILES])
+            transcriptions = transcription.transcribe_audio_segments_batch([
+                transcription.TranscribeAudioSegmentInput(
+                    audio_file=path, waveform=waveform, sample_rate=sample_rate,
+                )
+                for path, (waveform, sample_rate) in audio.items()
+            ])
+            # Wait for the previous step's diarizations first, so that at most
+            # two steps of decoded audio are held in memory
+            wait(diarizing)
+            diarizing = [
+                diarize_executor.submit(
+                    speaker_diarization.diarize,
+                    speaker_diarization.DiarizeInput(
+                        audio_file=path, waveform=waveform, sample_rate=sample_rate,
+                    ),
+                )
+                for path, (waveform, sample_rate) in audio.items()
+            ]
+            for path, diarized, result in zip(
+                audio, diarizing, transcriptions, strict=True,
+            ):
+                # Failed transcriptions are reported as "False" and not analyzed
+                text = result.transcription
+                file_results[path] = (
+                    diarized,
+                    None if text == "False"
+                    else analyse_executor.submit(_analyze_batch_text, text),
+                )
+            # The queued diarizations now hold the only references to the
+            # waveforms, which are dropped as each diarization finishes
+            del audio
+    if not file_results:
+        console.print("[bold red]No audio files to process.[/bold red]")
+        return
+
+    summary_table = Table(
+        title="Batch Summary",
+        show_header=True,
+        header_style="bold magenta",
+        show_lines=True,
     )
-    sentiment_speaker_2 = (
-        sentiment_analysis.analyse_sentiment(
-            sentiment_analysis.AnalyseSentimentInput(
-                transcribed_text=speaker_2_data.speech if speaker_2_data else "",
-            ),
+    for column in (
+        "File", "Speakers", "Interruptions", "Category", "Sentiment",
+        "PII", "Profanity", "Required Phrases",
+    ):
+        summary_table.add_column(column, style="cyan" if column == "File" else "green")
+
+    for path, (diarized, analysis) in file_results.items():
+        diarization = diarized.result()
+        speakers = len({segment.speaker for segment in diarization.speaker_segments})
+        if analysis is None:
+            text_cells = ("N/A",) * 5
+        else:
+            category, sentiment, pii, profanity, phrases = analysis.result()
+            text_cells = (
+                category.category,
+                sentiment.overall_sentiment,
+                str(pii.detected),
+                str(profanity.detected),
+                str(phrases.required_phrases_present),
+            )
+        summary_table.add_row(
+            Path(path).name, str(speakers), str(diarization.interruptions),
+            *text_cells,
         )
-        if speaker_2_data
-        else None
-    )
-    summary_table.add_row(
-        "Sentiment Analysis",
-        f"Polarity: {sentiment_speaker_1.polarity if sentiment_speaker_1 else 'N/A'}\n"
-        f"Subjectivity: {sentiment_speaker_1.subjectivity
-        if sentiment_speaker_1 else 'N/A'}\n"
-        f"Overall: {sentiment_speaker_1.overall_sentiment
-        if sentiment_speaker_1 else 'N/A'}",
-        f"Polarity: {sentiment_speaker_2.polarity
-        if sentiment_speaker_2 else 'N/A'}\n"
-        f"Subjectivity: {sentiment_speaker_2.subjectivity
-        if sentiment_speaker_2 else 'N/A'}\n"
-        f"Overall: {sentiment_speaker_2.overall_sentiment
-        if sentiment_speaker_2 else 'N/A'}",
-    )
-
-    # Display the summary table
     console.print(summary_table)
 
 
-def run_all(audio_file_path: str) -> None:
-    """Run all analysis functions on a given audio file."""
-    full_transcription = display_transcription(audio_file_path)
-    diarization_results = display_diarization(audio_file_path)
-    speaker_speech_data, speed_results = display_speaker_speed(
-        audio_file_path, diarization_results,
-    )
-    display_pii_check(full_transcription.transcription)
-    display_profanity_check(full_transcription.transcription)
-    display_required_phrases_check(full_transcription.transcription)
-    display_sentiment_analysis(full_transcription.transcription)
-    display_call_categorization(full_transcription.transcription)
-    display_summary_table(speaker_speech_data, speed_results)
+def _clear_cache() -> None:
+    """Remove every cached model result."""
+    from call_processor_modules.result_cache import clear_results
+
+    console.print(f"[bold]Removed {clear_results()} cached results.[/bold]")
+
+
+def _ask_batch() -> None:
+    """Ask for a directory or glob and run a batch analysis on its files."""
+    pattern = questionary.text("Enter a directory or glob:").ask()
+    # Ctrl-C answers None, which returns to the menu
+    if pattern is not None:
+        run_batch(_expand_audio_paths(pattern))
+
+
+def _ask_audio_file(session: dict) -> str | None:
+    """Ask for the audio file, offering to reuse the previous one.
+
+    Choosing a different file drops the transcription kept for the previous
+    one.
+
+    :return: The audio file, or None when the question was cancelled.
+    """
+    previous = session["audio_file"]
+    if previous and questionary.confirm(f"Use previous file {previous}?").ask():
+        return previous
+    audio_file = questionary.text("Enter the path to the audio file:").ask()
+    # Ctrl-C answers None, which returns to the menu and keeps the session
+    if audio_file is None:
+        return None
+    if audio_file != previous:
+        session["audio_file"] = audio_file
+        session["transcription"] = None
+    return audio_file
+
+
+def _ensure_transcription(session: dict) -> str:
+    """Return the session file's transcription, transcribing it only once."""
+    from call_processor_modules import transcription
+
+    if session["transcription"] is None:
+        transcription_input = transcription.TranscribeAudioSegmentInput(
+            audio_file=session["audio_file"],
+        )
+        _remember_transcription(
+            session, transcription.transcribe_audio_segment(transcription_input))
+    return session["transcription"]
+
+
+def _remember_transcription(
+    session: dict, result: "TranscribeAudioSegmentOutput | None",
+) -> None:
+    """Keep a transcription for reuse, unless transcribing failed."""
+    # Failed transcriptions are reported as "False" and must not be reused
+    if result is not None and result.transcription != "False":
+        session["transcription"] = result.transcription
 
 
 def tui_interface() -> None:
     """Interactive Text-based UI."""
     choices = [
         "Run All Analyses",
+        "Run Batch Analysis",
         "Transcribe Audio",
         "Perform Speaker Diarization",
         "Analyze Speaker Speed",
@@ -373,82 +732,70 @@ def tui_interface() -> None:
         "Check Required Phrases",
         "Analyze Sentiment",
         "Categorize Call",
+        "Clear Cache",
         "Exit",
     ]
+    # Text analyses take the transcription of the last audio file
+    text_analyses = {
+        "Check PII": display_pii_check,
+        "Check Profanity": display_profanity_check,
+        "Check Required Phrases": display_required_phrases_check,
+        "Analyze Sentiment": display_sentiment_analysis,
+        "Categorize Call": display_call_categorization,
+    }
+    # Choices that do not ask for an audio file
+    file_free_actions = {
+        "Run Batch Analysis": _ask_batch,
+        "Clear Cache": _clear_cache,
+    }
+    # The last audio file and its transcription, reused across menu choices
+    session = {"audio_file": None, "transcription": None}
 
     while True:
         choice = questionary.select("Choose an analysis to run:", choices).ask()
 
+        if choice == "Exit":
+            break
+        if choice is None:
+            continue
+
+        if choice in file_free_actions:
+            file_free_actions[choice]()
+            continue
+
+        audio_file = _ask_audio_file(session)
+        if audio_file is None:
+            continue
+
         if choice == "Run All Analyses":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            run_all(audio_file)
+            _remember_transcription(session, run_all(audio_file))
 
         elif choice == "Transcribe Audio":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            display_transcription(audio_file)
+            if session["transcription"] is None:
+                _remember_transcription(session, display_transcription(audio_file))
+            else:
+                console.print(
+                    f"[bold]Transcription:[/bold]\n{session['transcription']}")
 
         elif choice == "Perform Speaker Diarization":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
             display_diarization(audio_file)
 
         elif choice == "Analyze Speaker Speed":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            diarization_results = display_diarization(audio_file)
-            display_speaker_speed(audio_file, diarization_results)
-
-        elif choice == "Check PII":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            transcription_input = transcription.TranscribeAudioSegmentInput(
-                audio_file=audio_file,
-            )
-            transcription_result = transcription.transcribe_audio_segment(
-                transcription_input,
-            )
-            display_pii_check(transcription_result.transcription)
-
-        elif choice == "Check Profanity":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            transcription_input = transcription.TranscribeAudioSegmentInput(
-                audio_file=audio_file,
-            )
-            transcription_result = transcription.transcribe_audio_segment(
-                transcription_input,
-            )
-            display_profanity_check(transcription_result.transcription)
+            analyze_speaker_speed(audio_file)
 
-        elif choice == "Check Required Phrases":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            transcription_input = transcription.TranscribeAudioSegmentInput(
-                audio_file=audio_file,
-            )
-            transcription_result = transcription.transcribe_audio_segment(
-                transcription_input,
-            )
-            display_required_phrases_check(transcription_result.transcription)
-
-        elif choice == "Analyze Sentiment":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            transcription_input = transcription.TranscribeAudioSegmentInput(
-                audio_file=audio_file,
-            )
-            transcription_result = transcription.transcribe_audio_segment(
-                transcription_input,
-            )
-            display_sentiment_analysis(transcription_result.transcription)
-
-        elif choice == "Categorize Call":
-            audio_file = questionary.text("Enter the path to the audio file:").ask()
-            transcription_input = transcription.TranscribeAudioSegmentInput(
-                audio_file=audio_file,
-            )
-            transcription_result = transcription.transcribe_audio_segment(
-                transcription_input,
-            )
-            display_call_categorization(transcription_result.transcription)
-
-        elif choice == "Exit":
-            break
+        elif choice in text_analyses:
+            text_analyses[choice](_ensure_transcription(session))
 
 
 if __name__ == "__main__":
+    # Run as a script, so make the project root importable for the processing
+    # modules, which are imported on first use
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+    # Hide the model libraries' user warnings, which would clutter the
+    # interface, but keep every other warning visible
+    warnings.filterwarnings(
+        "ignore",
+        category=UserWarning,
+        module=r"(torch|torchaudio|pyannote|speechbrain|whisper)(\.|$)",
+    )
     tui_interface()